@@ -1,15 +1,32 @@
 import argparse
+import sys
+import time
+
+import numpy as np
 import robosuite
 from robosuite.controllers import load_composite_controller_config
-from termcolor import colored
 from robosuite.devices import Keyboard
 from robocasa.scripts.collect_demos import collect_human_trajectory
 
+# ANSI 颜色前缀
+_YEL = "\033[33m"
+_GRN = "\033[32m"
+_RST = "\033[0m"
+
 if __name__ == "__main__":
     # Arguments
     parser = argparse.ArgumentParser()
     parser.add_argument("--task", type=str, default="BasicEnvChef", help="task")
     parser.add_argument("--robot", type=str, default="PandaOmron", help="robot")
+    parser.add_argument(
+        "--num_envs",
+        type=int,
+        default=1,
+        help="if > 1, step this many headless envs in parallel with random actions",
+    )
+    parser.add_argument(
+        "--num_steps", type=int, default=100, help="steps to run with --num_envs > 1"
+    )
     args = parser.parse_args()
 
     # 固定使用 layout=3 和 style=3
@@ -25,11 +42,41 @@ if __name__ == "__main__":
         "robots": args.robot,
         "controller_configs": controller_config,
         "translucent_robot": False,
+        "layout_and_style_ids": [[layout, style]],
     }
 
+    if args.num_envs > 1:
+        # env_utils 会引入数据集相关模块，仅在需要时导入
+        from robocasa.utils.env_utils import make_env_pool
+
+        print(f"{_YEL}Initializing {args.num_envs} environments...{_RST}")
+        pool = make_env_pool(
+            args.num_envs,
+            **config,
+            has_renderer=False,
+            has_offscreen_renderer=False,
+            ignore_done=True,
+            use_camera_obs=False,
+            control_freq=20,
+        )
+        pool.reset()
+
+        low, high = pool.action_spec
+        start = time.time()
+        for _ in range(args.num_steps):
+            actions = np.random.uniform(low, high, size=(len(pool), len(low)))
+            pool.step(actions)
+        elapsed = time.time() - start
+        print(
+            f"{_GRN}Stepped {len(pool)} envs x {args.num_steps} steps "
+            f"({len(pool) * args.num_steps / elapsed:.1f} steps/s){_RST}"
+        )
+        pool.close()
+        sys.exit()
+
     args.renderer = "mjviewer"
 
-    print(colored("Initializing environment...", "yellow"))
+    print(f"{_YEL}Initializing environment...{_RST}")
 
     # 创建环境
     env = robosuite.make(
@@ -43,19 +90,14 @@ if __name__ == "__main__":
         renderer=args.renderer,
     )
 
-    # 设置布局和样式
-    env.layout_and_style_ids = [[layout, style]]
-
     # 初始化键盘控制
     device = Keyboard(env=env, pos_sensitivity=4.0, rot_sensitivity=4.0)
 
     print(
-        colored(
-            f"Showing configuration:\n    Layout: {layout}\n    Style: {style}", "green"
-        )
+        f"{_GRN}Showing configuration:\n    Layout: {layout}\n    Style: {style}{_RST}"
     )
     print()
-    print(colored("Spawning environment...\n(Press Q to quit)", "yellow"))
+    print(f"{_YEL}Spawning environment...\n(Press Q to quit){_RST}")
 
     # 单次展示环境，注意 render 参数设置
     collect_human_trajectory(
@@ -883,11 +883,11 @@ class KitchenChef(ManipulationEnv, metaclass=KitchenEnvMeta):
             object_placements = self.object_placements
 
             # Loop through all objects and reset their positions
+            qpos = self.sim.data.qpos
             for obj_pos, obj_quat, obj in object_placements.values():
-                self.sim.data.set_joint_qpos(
-                    obj.joints[0],
-                    np.concatenate([np.array(obj_pos), np.array(obj_quat)]),
-                )
+                addr = self.obj_qpos_addr[obj.name]
+                qpos[addr : addr + 3] = obj_pos
+                qpos[addr + 3 : addr + 7] = obj_quat
 
         # step through a few timesteps to settle objects
         action = np.zeros(self.action_spec[0].shape)  # apply empty action
@@ -1134,8 +1134,13 @@ class KitchenChef(ManipulationEnv, metaclass=KitchenEnvMeta):
         super()._setup_references()
 
         self.obj_body_id = {}
+        self.obj_qpos_addr = {}
         for (name, model) in self.objects.items():
             self.obj_body_id[name] = self.sim.model.body_name2id(model.root_body)
+            # start index of the object's free joint (pos + quat) in qpos
+            self.obj_qpos_addr[name] = self.sim.model.get_joint_qpos_addr(
+                model.joints[0]
+            )[0]
 
     def _setup_observables(self):
         """
@@ -1,8 +1,51 @@
+import logging
+
 from robocasa.environments.kitchen._kitchen_chef import KitchenChef, FixtureType
+from robocasa.environments.kitchen.single_stage import _chef_kernels_src
+from robocasa.models.fixtures import Fixture
 
 # from robocasa_extension.utilities.scene_utils import SceneConfigGenerator
 import numpy as np
-import inspect
+from robosuite.utils.numba import jit_decorator
+
+logger = logging.getLogger(__name__)
+
+# 餐具上放置对象时的偏移量
+_UTENSIL_OFFSETS = {
+    k: np.array(v, dtype=np.float64)
+    for k, v in {
+        "pot": (0, 0, 0.02),
+        "pan": (0, 0, 0.05),
+        "plate": (0, 0, 0.05),
+        "mug": (0, 0, 0.02),
+    }.items()
+}
+_DEFAULT_OFFSET = np.array([0.0, 0.0, 0.02])
+
+# 工具放置到夹持器时的偏移量和默认方向
+_TOOL_OFFSET = np.array([0.0, 0.0, 0.05])
+_TOOL_QUAT = np.array([1.0, 0.0, 0.0, 0.0])
+
+# 可以放置在机器人夹持器中的工具
+_GRIPPER_TOOLS = ("spatula", "fork", "knife", "spoon")
+
+# 名称中包含这些关键字的设备可能可以开关门
+_OPENABLE_TOKENS = ("cab", "microwave", "fridge")
+
+# open_fixtures 中包含 "fridge" 时需要一并打开的冰箱部件
+_FRIDGE_PARTS = ("fridge_housing", "fridge_cab", "fridge_top")
+
+# 放置初始化器缓存的最大条目数，超出时淘汰最早加入的条目
+_PLACEMENT_CACHE_SIZE = 32
+
+
+try:
+    # 预编译版本，见 _chef_kernels_aot.py
+    from robocasa.environments.kitchen.single_stage._chef_kernels import (
+        compose_pose as _compose_pose,
+    )
+except ImportError:
+    _compose_pose = jit_decorator(_chef_kernels_src.compose_pose)
 
 
 class BasicEnvChef(KitchenChef):
@@ -15,23 +58,88 @@ class BasicEnvChef(KitchenChef):
         self.objects = {}
         self.tool_types = {"tool", "utensil"}
 
-        # 保存初始对象配置
-        self.initial_objects = self.objects_to_spawn.copy()
-        self.current_objects = self.objects_to_spawn.copy()
+        # 保存初始对象配置（元组快照，重置时无需再复制）
+        self.initial_objects = tuple(self.objects_to_spawn)
+        self.current_objects = self.objects_to_spawn
 
         # 延迟初始化对象配置
         self._obj_cfg = None
 
+        # 放置初始化器缓存，键为对象配置签名，重新加载模型时清空
+        self._placement_init_cache = {}
+
+        # 预热位姿计算函数，避免首次重置时触发 JIT 编译
+        _compose_pose(_DEFAULT_OFFSET, _TOOL_OFFSET, _TOOL_QUAT, np.empty(7))
+
         super().__init__(*args, **kwargs)
 
     @property
     def obj_cfg(self):
         """延迟加载对象配置"""
         if self._obj_cfg is None:
-            print("\n=== 首次创建对象配置 ===")
+            logger.debug("=== 首次创建对象配置 ===")
             self._obj_cfg = self._get_obj_cfgs()
         return self._obj_cfg
 
+    @property
+    def open_fixtures(self):
+        """需要打开的设备名称（元组，修改时需整体重新赋值）"""
+        return self._open_fixtures
+
+    @open_fixtures.setter
+    def open_fixtures(self, open_fixtures):
+        # 保存不可变副本，原地修改会直接报错，而不是被开关决策静默忽略
+        self._open_fixtures = tuple(open_fixtures)
+        self._open_set = frozenset(open_fixtures)
+        self._fridge_open = "fridge" in self._open_set
+        if hasattr(self, "_openable_fixtures"):
+            self._resolve_fixture_open_states()
+
+    def _resolve_fixture_open_states(self):
+        """预先计算每个可开启设备是否需要打开"""
+        self._fixture_should_open = []
+        for fixture_name, fixture in self._openable_fixtures:
+            should_open = fixture_name in self._open_set or (
+                self._fridge_open and any(x in fixture_name for x in _FRIDGE_PARTS)
+            )
+            self._fixture_should_open.append((fixture_name, fixture, should_open))
+
+    def _build_spawn_arrays(self, configs):
+        """将对象配置转换为并行数组（SoA），重置时直接用布尔掩码筛选对象
+
+        需在模型加载后调用，此时未命名的对象已被分配名称。
+
+        Args:
+            configs: 对象配置列表
+        """
+        self._spawn_names = np.array([cfg.get("name") for cfg in configs], dtype=object)
+        self._spawn_in_gripper = np.array(
+            [
+                cfg.get("name") in _GRIPPER_TOOLS
+                and cfg.get("is_in_gripper") == True
+                and cfg.get("state") == "in_use"
+                for cfg in configs
+            ],
+            dtype=bool,
+        )
+
+        # 只有放在餐具上的对象需要读取 location，且 location 必须是餐具名称
+        on_utensil = [
+            i
+            for i, cfg in enumerate(configs)
+            if cfg.get("is_on_utensil") and isinstance(cfg.get("location"), str)
+        ]
+        self._utensil_obj_names = self._spawn_names[on_utensil]
+        self._utensil_locations = np.array(
+            [configs[i]["location"] for i in on_utensil], dtype=object
+        )
+        self._utensil_offsets = np.array(
+            [
+                _UTENSIL_OFFSETS.get(loc, _DEFAULT_OFFSET)
+                for loc in self._utensil_locations
+            ]
+        ).reshape(-1, 3)
+
     def _is_tool(self, obj):
         """判断对象是否为工具或餐具"""
         return isinstance(obj, dict) and (
@@ -39,6 +147,10 @@ class BasicEnvChef(KitchenChef):
             or obj.get("is_tool", False)  # 通过类型判断
         )  # 通过标记判断
 
+    def _load_model(self):
+        super()._load_model()
+        self._build_spawn_arrays(self.objects_to_spawn)
+
     def _setup_kitchen_references(self):
         """设置厨房引用"""
         super()._setup_kitchen_references()
@@ -50,241 +162,123 @@ class BasicEnvChef(KitchenChef):
         )
         self.coffee_machine = self.get_fixture("coffee_machine")
         self.microwave = self.get_fixture(FixtureType.MICROWAVE)
-        self.fridge = next(
-            (
-                fixture
-                for name, fixture in self.fixtures.items()
-                if "fridge" in name.lower()
-            ),
-            None,
-        )
-        self.stove = next(
-            (
-                fixture
-                for name, fixture in self.fixtures.items()
-                if "stove" in name.lower()
-            ),
-            None,
-        )
-        self.shelves = next(
-            (
-                fixture
-                for name, fixture in self.fixtures.items()
-                if "shelves" in name.lower() or "shelf" in name.lower()
-            ),
-            None,
-        )
-        self.cab_main = self.get_fixture("cab_main_main_group")
-
-        self.init_robot_base_pos = self.cab_main
 
-        # 打印机器人末端执行器位置信息
-        if hasattr(self, "sim"):
-            try:
-                # 使用正确的 site 名称
-                eef_site_id = self.sim.model.site_name2id("gripper0_right_grip_site")
-                sim_eef_pos = self.sim.data.site_xpos[eef_site_id]
-                print(f"\n=== Robot End Effector Info ===")
-                print(f"Simulator Position: {sim_eef_pos}")
-            except Exception as e:
-                print(f"\n获取末端执行器位置失败: {str(e)}")
-                # 打印所有可用的 site 名称，用于调试
-                print("可用的 site 名称:")
-                for i in range(self.sim.model.nsite):
-                    print(f"- {self.sim.model.site_id2name(i)}")
-
-        # 获取所有可开启设备
+        # 单次遍历所有设备：查找冰箱/炉灶/置物架，并收集所有可开启设备
+        self.fridge = self.stove = self.shelves = None
         self.all_openable_fixtures = []
-        for fixture_name in self.fixtures:
-            if (
-                "cabinet" in fixture_name.lower()
-                or "cab" in fixture_name.lower()
-                or "microwave" in fixture_name.lower()
-                or "fridge" in fixture_name.lower()
+        for name, fixture in self.fixtures.items():
+            name = name.lower()
+            if self.fridge is None and "fridge" in name:
+                self.fridge = fixture
+            if self.stove is None and "stove" in name:
+                self.stove = fixture
+            if self.shelves is None and "shelf" in name:  # 同时匹配 "shelves"
+                self.shelves = fixture
+            if any(token in name for token in _OPENABLE_TOKENS) and hasattr(
+                fixture, "set_door_state"
             ):
-                fixture = self.get_fixture(fixture_name)
-                if hasattr(fixture, "set_door_state"):
-                    self.all_openable_fixtures.append(fixture)
+                self.all_openable_fixtures.append(fixture)
+        self._openable_fixtures = [
+            (getattr(fixture, "name", "Unknown"), fixture)
+            for fixture in self.all_openable_fixtures
+        ]
+        self._resolve_fixture_open_states()
+
+        self.cab_main = self.get_fixture("cab_main_main_group")
+
+        # 设备和对象模型已重新创建，旧的放置初始化器不再可用
+        self._placement_init_cache = {}
+
+        self.init_robot_base_pos = self.cab_main
 
         # print("\n=== Debug: Openable fixtures ===")
         # for fixture in self.all_openable_fixtures:
         #     print(f"- {fixture.name if hasattr(fixture, 'name') else 'Unknown'}")
 
+    def _setup_references(self):
+        """设置仿真引用（每次创建新的 sim 后调用）"""
+        super()._setup_references()
+
+        # 缓存末端执行器 site id，避免每次重置时重复查找（不存在时为 -1）
+        try:
+            self._eef_site_id = self.sim.model.site_name2id("gripper0_right_grip_site")
+        except Exception:
+            self._eef_site_id = -1
+            logger.warning("eef site gripper0_right_grip_site not found")
+
+    def _dump_sites(self):
+        """打印所有可用的 site 名称，用于调试"""
+        for i in range(self.sim.model.nsite):
+            print(f"- {self.sim.model.site_id2name(i)}")
+
     def _reset_internal(self):
         """初始化重置 - 仅用于环境首次创建的基础组件初始化"""
         try:
-            print("\n=== 初始化基础环境组件 ===")
+            logger.debug("=== 初始化基础环境组件 ===")
 
-            # 1. 保存当前对象配置
-            current_configs = (
-                self.objects_to_spawn.copy()
-                if hasattr(self, "objects_to_spawn")
-                else []
-            )
-            # print(f"current_configs: {current_configs}")
-
-            # 2. 调用父类的重置方法
+            # 1. 调用父类的重置方法
             super()._reset_internal()
 
-            # 3. 处理柜门状态
-            print("\n=== Debug: Setting fixture states ===")
-            print(f"Debug - Open fixtures list: {self.open_fixtures}")
-
-            for fixture in self.all_openable_fixtures:
+            # 2. 处理柜门状态
+            logger.debug("=== Setting fixture states ===")
+            logger.debug("Open fixtures list: %s", self.open_fixtures)
+
+            self._apply_fixture_open_states()
+
+            # 3. 处理对象在餐具上的放置
+            logger.debug("=== 处理对象在餐具上的放置 ===")
+            idx = [
+                i
+                for i, (obj_name, utensil_name) in enumerate(
+                    zip(self._utensil_obj_names, self._utensil_locations)
+                )
+                if obj_name in self.objects and utensil_name in self.objects
+            ]
+            if idx:
+                obj_names = self._utensil_obj_names[idx]
+                utensil_names = self._utensil_locations[idx]
                 try:
-                    if hasattr(fixture, "set_door_state"):
-                        fixture_name = (
-                            fixture.name if hasattr(fixture, "name") else "Unknown"
-                        )
-                        should_open = any(
-                            [
-                                fixture_name in self.open_fixtures,
-                                (
-                                    "fridge" in self.open_fixtures
-                                    and any(
-                                        x in fixture_name
-                                        for x in [
-                                            "fridge_housing",
-                                            "fridge_cab",
-                                            "fridge_top",
-                                        ]
-                                    )
-                                ),
-                            ]
+                    target_pos = self._place_on_utensils(
+                        obj_names, utensil_names, self._utensil_offsets[idx]
+                    )
+                    for obj_name, utensil_name, pos in zip(
+                        obj_names, utensil_names, target_pos
+                    ):
+                        logger.debug(
+                            "放置对象 %s 到 %s, 目标位置: %s", obj_name, utensil_name, pos
                         )
 
-                        if should_open:
-                            print(f"Opening {fixture_name}")
-                            fixture.set_door_state(
-                                min=0.98, max=1.0, env=self, rng=self.rng
-                            )
-                        else:
-                            print(f"Closing {fixture_name}")
-                            fixture.set_door_state(
-                                min=0.0, max=0.02, env=self, rng=self.rng
-                            )
-                    else:
-                        print(
-                            f"Warning: Fixture {fixture} does not have set_door_state method"
-                        )
-                except Exception as e:
-                    print(f"Error setting state for fixture {fixture}: {str(e)}")
+                except Exception:
+                    logger.exception("放置对象 %s 到餐具 %s 上时出错", obj_names, utensil_names)
 
-            # 4. 处理对象在餐具上的放置
-            print("\n=== 处理对象在餐具上的放置 ===")
-            for obj_config in current_configs:
-                if obj_config.get("is_on_utensil"):
-                    try:
-                        obj_name = obj_config["name"]
-                        utensil_name = obj_config["location"]
-
-                        if utensil_name in self.objects and obj_name in self.objects:
-                            # 获取餐具对象和关节
-                            utensil_obj = self.objects[utensil_name]
-                            utensil_joint = utensil_obj.joints[0]
-
-                            # 获取餐具位置
-                            utensil_pos = self.sim.data.get_joint_qpos(utensil_joint)[
-                                :3
-                            ]
-                            print(f"\n放置对象 {obj_name} 到 {utensil_name}:")
-                            print(f"- 餐具位置: {utensil_pos}")
-
-                            # 计算偏移量
-                            offset = np.array(
-                                {
-                                    "pot": (0, 0, 0.02),
-                                    "pan": (0, 0, 0.05),
-                                    "plate": (0, 0, 0.05),
-                                    "mug": (0, 0, 0.02),
-                                }.get(utensil_name, (0, 0, 0.02))
-                            )
-
-                            # 计算目标位置
-                            target_pos = utensil_pos + offset
-
-                            # 获取对象关节并更新位置
-                            obj = self.objects[obj_name]
-                            obj_joint = obj.joints[0]
-
-                            # 保持当前的方向
-                            current_quat = self.sim.data.get_joint_qpos(obj_joint)[3:7]
-
-                            # 设置新的位置和方向
-                            joint_pos = np.concatenate([target_pos, current_quat])
-                            self.sim.data.set_joint_qpos(obj_joint, joint_pos)
-
-                            # 更新模拟器状态
-                            self.sim.forward()
-
-                            # 验证更新后的位置
-                            current_pos = self.sim.data.get_joint_qpos(obj_joint)[:3]
-                            print(f"- 目标位置: {target_pos}")
-                            print(f"- 当前位置: {current_pos}")
-
-                    except Exception as e:
-                        print(f"放置对象 {obj_name} 到餐具 {utensil_name} 上时出错: {str(e)}")
-                        import traceback
-
-                        traceback.print_exc()
-
-            # 5. 处理工具在机器人夹持器上的放置
-            print("\n=== 处理工具在机器人夹持器上的放置 ===")
-
-            # 获取所有工具对象
-            tools = ["spatula", "fork", "knife", "spoon"]
-
-            for obj_name in tools:
-                if obj_name in self.objects:
+            # 4. 处理工具在机器人夹持器上的放置
+            logger.debug("=== 处理工具在机器人夹持器上的放置 ===")
+            qpos = self.sim.data.qpos
+
+            for obj_name in self._spawn_names[self._spawn_in_gripper]:
+                if obj_name in self.objects and self._eef_site_id >= 0:
                     try:
-                        # 检查工具是否在夹持器中 - 修改检查条件
-                        tool_config = next(
-                            (
-                                cfg
-                                for cfg in current_configs
-                                if cfg["name"] == obj_name
-                                and cfg.get("is_in_gripper") == True
-                                and cfg.get("state") == "in_use"
-                            ),
-                            None,
+                        logger.debug("处理工具: %s", obj_name)
+
+                        # 更新工具位置（末端执行器位置 + 偏移量，默认方向）
+                        tool_addr = self.obj_qpos_addr[obj_name]
+                        _compose_pose(
+                            self.sim.data.site_xpos[self._eef_site_id],
+                            _TOOL_OFFSET,
+                            _TOOL_QUAT,
+                            qpos[tool_addr : tool_addr + 7],
                         )
 
-                        if tool_config:
-                            print(f"\n处理工具: {obj_name}")
-                            tool_obj = self.objects[obj_name]
-
-                            # 获取末端执行器位置
-                            eef_site_id = self.sim.model.site_name2id(
-                                "gripper0_right_grip_site"
-                            )
-                            eef_pos = self.sim.data.site_xpos[eef_site_id]
-                            default_quat = np.array([1.0, 0.0, 0.0, 0.0])
-
-                            # 添加工具偏移量
-                            tool_offset = np.array([0.0, 0.0, 0.05])
-                            tool_pos = eef_pos + tool_offset
-
-                            # 设置工具位置
-                            joint_name = tool_obj.joints[0]
-                            joint_pos = np.concatenate([tool_pos, default_quat])
-
-                            # 更新工具位置
-                            self.sim.data.set_joint_qpos(joint_name, joint_pos)
-                            self.sim.forward()
+                        logger.debug("工具 %s 已放置到机器人夹持器", obj_name)
 
-                            print(f"工具 {obj_name} 已放置到机器人夹持器")
+                    except Exception:
+                        logger.exception("处理工具 %s 时出错", obj_name)
 
-                    except Exception as e:
-                        print(f"处理工具 {obj_name} 时出错: {str(e)}")
-                        import traceback
-
-                        traceback.print_exc()
-
-        except Exception as e:
-            print(f"重置内部状态失败: {str(e)}")
-            import traceback
+            # 所有位姿写入完成后统一更新模拟器状态
+            self.sim.forward()
 
-            traceback.print_exc()
+        except Exception:
+            logger.exception("重置内部状态失败")
 
     def update_environment_state(self, changed_configs=None):
         """更新环境状态
@@ -292,84 +286,54 @@ class BasicEnvChef(KitchenChef):
             changed_configs: 需要更新的配置列表，如果为None则更新所有配置
         """
         try:
-            print("\n=== 更新环境状态 ===")
+            logger.debug("=== 更新环境状态 ===")
 
             # 1. 更新普通对象位置
             if changed_configs:  # 检查changed_configs而不是self.objects_to_spawn
-                print(f"需要更新的对象: {[cfg['name'] for cfg in changed_configs]}")
+                logger.debug("需要更新的对象: %s", [cfg["name"] for cfg in changed_configs])
                 self._update_object_placements(changed_configs)
             else:
-                print("没有对象需要更新位置")
+                logger.debug("没有对象需要更新位置")
 
             # 2. 更新设备状态
             if hasattr(self, "all_openable_fixtures") and self.all_openable_fixtures:
                 self._update_fixture_states()
 
-        except Exception as e:
-            print(f"更新环境状态失败: {str(e)}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("更新环境状态失败")
 
     def _update_fixture_states(self):
         """更新设备状态（如柜门开关）"""
         try:
-            print("\n=== 更新设备状态 ===")
-            print(f"需要打开的设备: {self.open_fixtures}")
+            logger.debug("=== 更新设备状态 ===")
+            logger.debug("需要打开的设备: %s", self.open_fixtures)
 
-            for fixture in self.all_openable_fixtures:
-                try:
-                    if hasattr(fixture, "set_door_state"):
-                        fixture_name = (
-                            fixture.name if hasattr(fixture, "name") else "Unknown"
-                        )
-                        should_open = any(
-                            [
-                                fixture_name in self.open_fixtures,
-                                (
-                                    "fridge" in self.open_fixtures
-                                    and any(
-                                        x in fixture_name
-                                        for x in [
-                                            "fridge_housing",
-                                            "fridge_cab",
-                                            "fridge_top",
-                                        ]
-                                    )
-                                ),
-                            ]
-                        )
+            self._apply_fixture_open_states()
+
+        except Exception:
+            logger.exception("更新设备状态失败")
 
-                        if should_open:
-                            print(f"打开设备 {fixture_name}")
-                            fixture.set_door_state(
-                                min=0.98, max=1.0, env=self, rng=self.rng
-                            )
-                        else:
-                            print(f"关闭设备 {fixture_name}")
-                            fixture.set_door_state(
-                                min=0.0, max=0.02, env=self, rng=self.rng
-                            )
-                    else:
-                        print(f"警告: 设备 {fixture} 不支持状态设置")
-                except Exception as e:
-                    print(f"设置设备 {fixture} 状态失败: {str(e)}")
-
-        except Exception as e:
-            print(f"更新设备状态失败: {str(e)}")
-            import traceback
-
-            traceback.print_exc()
+    def _apply_fixture_open_states(self):
+        """根据预先计算的开关决策设置所有可开启设备的门状态"""
+        for fixture_name, fixture, should_open in self._fixture_should_open:
+            try:
+                if should_open:
+                    logger.debug("打开设备 %s", fixture_name)
+                    fixture.set_door_state(min=0.98, max=1.0, env=self, rng=self.rng)
+                else:
+                    logger.debug("关闭设备 %s", fixture_name)
+                    fixture.set_door_state(min=0.0, max=0.02, env=self, rng=self.rng)
+            except Exception as e:
+                logger.error("设置设备 %s 状态失败: %s", fixture_name, e)
 
     def _update_object_placements(self, changed_configs=None):
         try:
             if not self.objects_to_spawn:
-                print("没有对象需要更新位置")
+                logger.debug("没有对象需要更新位置")
                 return False
 
-            print("\n=== 更新对象位置 ===")
-
-            print(f"changed_configs: {changed_configs}")
+            logger.debug("=== 更新对象位置 ===")
+            logger.debug("changed_configs: %s", changed_configs)
             # 分离普通对象和在餐具上的对象
             regular_objects = []
             utensil_objects = []
@@ -377,60 +341,141 @@ class BasicEnvChef(KitchenChef):
             for obj in changed_configs:
                 if obj.get("placement", {}).get("use_utensil_reference"):
                     utensil_objects.append(obj)
-                    print(f"use utensil reference item: {obj['name']}")
+                    logger.debug("use utensil reference item: %s", obj["name"])
                 else:
                     regular_objects.append(obj)
-                    print(f"use regular item: {obj['name']}")
+                    logger.debug("use regular item: %s", obj["name"])
+
+            qpos = self.sim.data.qpos
 
             # 1. 处理普通对象
             if regular_objects:
-                placement_initializer = self._get_placement_initializer(regular_objects)
+                placement_initializer = self._get_cached_placement_initializer(
+                    regular_objects
+                )
                 object_placements = placement_initializer.sample()
 
                 for obj_name, placement_data in object_placements.items():
                     if obj_name in self.objects:
-                        obj = self.objects[obj_name]
                         pos, quat = placement_data[0], placement_data[1]
-                        joint_name = obj.joints[0]
-                        joint_pos = np.concatenate([np.array(pos), np.array(quat)])
-                        self.sim.data.set_joint_qpos(joint_name, joint_pos)
+                        addr = self.obj_qpos_addr[obj_name]
+                        qpos[addr : addr + 3] = pos
+                        qpos[addr + 3 : addr + 7] = quat
 
             # 2. 处理在餐具上的对象
-            for obj in utensil_objects:
-                obj_name = obj["name"]
-                if obj_name not in self.objects:
-                    continue
-
-                utensil_name = obj["placement"]["utensil_name"]
-                if utensil_name not in self.objects:
-                    continue
-
-                # 获取餐具位置
-                utensil_obj = self.objects[utensil_name]
-                utensil_joint = utensil_obj.joints[0]
-                utensil_pos = self.sim.data.get_joint_qpos(utensil_joint)[:3]
-
-                # 应用偏移
-                offset = obj["placement"]["offset"]
-                target_pos = utensil_pos + np.array(offset)
-
-                # 更新对象位置
-                obj_joint = self.objects[obj_name].joints[0]
-                current_quat = self.sim.data.get_joint_qpos(obj_joint)[3:7]
-                joint_pos = np.concatenate([target_pos, current_quat])
-                self.sim.data.set_joint_qpos(obj_joint, joint_pos)
+            utensil_objects = [
+                obj
+                for obj in utensil_objects
+                if obj["name"] in self.objects
+                and obj["placement"]["utensil_name"] in self.objects
+            ]
+            if utensil_objects:
+                self._place_on_utensils(
+                    [obj["name"] for obj in utensil_objects],
+                    [obj["placement"]["utensil_name"] for obj in utensil_objects],
+                    [obj["placement"]["offset"] for obj in utensil_objects],
+                )
 
             # 更新物理引擎
             self.sim.forward()
             return True
 
-        except Exception as e:
-            print(f"更新对象位置失败: {str(e)}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("更新对象位置失败")
             return False
 
+    def _get_cached_placement_initializer(self, cfg_list):
+        """按配置签名缓存放置初始化器，配置及其放置区域不变时重复使用
+
+        缓存键包含每个配置当前解析出的放置区域，设备状态改变区域（如抽屉开合）时
+        会重新创建。需要随机选择设备或区域的配置每次都重新创建，保证与未缓存时
+        消耗相同的随机数。
+        """
+        region_keys = [self._placement_region_key(cfg) for cfg in cfg_list]
+        if any(region_key is None for region_key in region_keys):
+            return self._get_placement_initializer(cfg_list)
+
+        key = tuple(
+            (cfg.get("name"), repr(cfg.get("placement", {})), region_key)
+            for cfg, region_key in zip(cfg_list, region_keys)
+        )
+        placement_initializer = self._placement_init_cache.get(key)
+        if placement_initializer is None:
+            placement_initializer = self._get_placement_initializer(cfg_list)
+            if len(self._placement_init_cache) >= _PLACEMENT_CACHE_SIZE:
+                del self._placement_init_cache[next(iter(self._placement_init_cache))]
+            self._placement_init_cache[key] = placement_initializer
+        return placement_initializer
+
+    def _placement_region_key(self, cfg):
+        """返回配置当前放置区域的签名（设备位姿、区域偏移和大小），用作缓存键
+
+        带 ref 的配置会在多个相近设备中随机选择；使用默认 sample_reset_region 的设备
+        在有多个重置区域时会随机选择区域，这两种情况返回 None，表示不可缓存。
+        重写了 sample_reset_region 的设备按参数选择区域（如置物架），视为确定的。
+        """
+        placement = cfg.get("placement")
+        if not placement or placement.get("fixture") is None:
+            return ()
+        if placement.get("ref") is not None:
+            return None
+        try:
+            fixture = self.get_fixture(id=placement["fixture"])
+            sample_region_kwargs = placement.get("sample_region_kwargs", {})
+            if type(fixture).sample_reset_region is Fixture.sample_reset_region:
+                regions = fixture.get_reset_regions(env=self, **sample_region_kwargs)
+                if len(regions) > 1:
+                    return None
+                (region,) = regions.values()
+            else:
+                region = fixture.sample_reset_region(env=self, **sample_region_kwargs)
+        except Exception:
+            # 初始化器同样会跳过该对象
+            return ()
+        return tuple(
+            tuple(np.asarray(x, dtype=np.float64).ravel().tolist())
+            for x in (fixture.pos, fixture.rot, region["offset"], region["size"])
+        )
+
+    def _place_on_utensils(self, obj_names, utensil_names, offsets):
+        """批量将对象放置到对应餐具上方（保持对象当前的方向）
+
+        若某个餐具本身也在本批次中被放置，则先放置该餐具，再放置其上的对象，
+        保证对象使用餐具的新位置。
+
+        Args:
+            obj_names: 需要放置的对象名称列表
+            utensil_names: 与对象一一对应的餐具名称列表
+            offsets: 与对象一一对应的 (x, y, z) 偏移量
+
+        Returns:
+            np.ndarray: (N, 3) 的目标位置
+        """
+        obj_names = list(obj_names)
+        utensil_names = list(utensil_names)
+        offsets = np.asarray(offsets, dtype=np.float64).reshape(-1, 3)
+
+        xyz = np.arange(3)
+        utensil_idx = np.array(
+            [self.obj_qpos_addr[n] for n in utensil_names], dtype=np.intp
+        )
+        obj_idx = np.array([self.obj_qpos_addr[n] for n in obj_names], dtype=np.intp)
+
+        qpos = self.sim.data.qpos
+        target_pos = np.empty((len(obj_names), 3))
+        pending = np.arange(len(obj_names))
+        while len(pending):
+            # 餐具不在待放置对象中的行可以一起放置
+            moving = {obj_names[i] for i in pending}
+            ready = pending[[utensil_names[i] not in moving for i in pending]]
+            if not len(ready):
+                # 存在循环依赖时按列表顺序逐个放置
+                ready = pending[:1]
+            target_pos[ready] = qpos[utensil_idx[ready, None] + xyz] + offsets[ready]
+            qpos[obj_idx[ready, None] + xyz] = target_pos[ready]
+            pending = np.setdiff1d(pending, ready)
+        return target_pos
+
     def _get_obj_cfgs(self):
         """获取对象配置"""
         # 直接返回已经配置好的对象列表
@@ -442,8 +487,8 @@ class BasicEnvChef(KitchenChef):
 
     def reset(self):
         """重置环境状态"""
-        print("\n=== 重置环境状态 ===")
+        logger.debug("=== 重置环境状态 ===")
         # 恢复初始对象配置
-        self.objects_to_spawn = self.initial_objects.copy()
-        self.current_objects = self.initial_objects.copy()
+        self.objects_to_spawn = list(self.initial_objects)
+        self.current_objects = self.objects_to_spawn
         return super().reset()
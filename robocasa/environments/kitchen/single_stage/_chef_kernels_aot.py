@@ -0,0 +1,28 @@
+"""
+Ahead-of-time compiled numeric kernels for BasicEnvChef.
+
+Build the extension module once (it is written next to this file):
+
+    python -m robocasa.environments.kitchen.single_stage._chef_kernels_aot
+
+_basicEnv_chef.py imports the compiled _chef_kernels module if it exists and
+falls back to the JIT-compiled versions of these kernels otherwise. Both are
+built from the pure-Python source in _chef_kernels_src.py.
+"""
+import os
+
+from numba.pycc import CC
+
+from robocasa.environments.kitchen.single_stage import _chef_kernels_src
+
+cc = CC("_chef_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+compose_pose = cc.export("compose_pose", "void(f8[:], f8[:], f8[:], f8[:])")(
+    _chef_kernels_src.compose_pose
+)
+
+
+if __name__ == "__main__":
+    cc.compile()
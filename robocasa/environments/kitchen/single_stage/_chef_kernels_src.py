@@ -0,0 +1,14 @@
+"""
+Pure-Python source of the numeric kernels for BasicEnvChef.
+
+_basicEnv_chef.py JIT-compiles these functions and _chef_kernels_aot.py exports
+them ahead of time, so both builds share a single implementation.
+"""
+
+
+def compose_pose(pos, offset, quat, out):
+    """将位置 pos + offset 与方向 quat 写入 7 维自由关节位姿 out"""
+    out[0] = pos[0] + offset[0]
+    out[1] = pos[1] + offset[1]
+    out[2] = pos[2] + offset[2]
+    out[3:7] = quat
@@ -1,14 +1,16 @@
-from copy import deepcopy
+import abc
+import functools
+import logging
 from xml.etree import ElementTree as ET
 
 import numpy as np
 from robosuite.utils.mjcf_utils import array_to_string as a2s
 from robosuite.utils.mjcf_utils import (
-    find_elements,
     find_parent,
     new_geom,
     xml_path_completion,
 )
+from robosuite.utils.numba import jit_decorator
 
 import robocasa
 import robocasa.utils.object_utils as OU
@@ -19,12 +21,128 @@ from robocasa.models.fixtures.fixture import (
 )
 from robocasa.utils.object_utils import (
     get_fixture_to_point_rel_offset,
-    set_geom_dimensions,
+    set_geom_dimensions_batch,
 )
-import random  # 添加这个导入
 
+logger = logging.getLogger(__name__)
 
-class Cabinet(ProcGenFixture):
+
+@functools.lru_cache(maxsize=512)
+def _a2s_floats(tpl):
+    """
+    memoized array_to_string for a tuple of python floats
+    """
+    return a2s(tpl)
+
+
+def _a2s_cached(values):
+    """
+    array_to_string, memoized since the same body/joint vectors recur across cabinets.
+    Values are converted to python floats first: ints, floats and numpy scalars that
+    compare equal share a cache entry, so they must also format the same way
+    """
+    return _a2s_floats(tuple(map(float, values)))
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_texture(tex, root):
+    """
+    memoized xml_path_completion for cabinet textures
+    """
+    return xml_path_completion(tex, root=root)
+
+
+@functools.lru_cache(maxsize=256)
+def _tex_name(path):
+    """
+    memoized get_texture_name_from_file for cabinet textures
+    """
+    return get_texture_name_from_file(path)
+
+
+# corner signs of the p0, px, py, pz bounds sites of a box centered at the origin
+_BOUNDS_SIGNS = np.array(
+    [[-1, -1, -1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]], dtype=np.float64
+)
+_EXT_SITE_NAMES = ("ext_p0", "ext_px", "ext_py", "ext_pz")
+_INT_SITE_NAMES = ("int_p0", "int_px", "int_py", "int_pz")
+
+
+def _centered_bounds_sites(ext_half, int_half):
+    """
+    exterior and interior bounds sites for boxes centered at the origin with the given half extents
+    """
+    ext = (_BOUNDS_SIGNS * ext_half).tolist()
+    interior = (_BOUNDS_SIGNS * int_half).tolist()
+    return {**dict(zip(_EXT_SITE_NAMES, ext)), **dict(zip(_INT_SITE_NAMES, interior))}
+
+
+# constant attributes of the collision and visual box geoms of panel and housing cabinets
+_COLL_KW = dict(type="box", group=0, density=10, rgba="0.5 0 0 1")
+_VIS_KW = dict(type="box", group=1, density=10, conaffinity=0, contype=0, mass=1e-8)
+
+
+def _new_collision_box(name, size, pos):
+    """
+    collision box geom for a cabinet body
+    """
+    return new_geom(name=name, size=size, pos=pos, **_COLL_KW)
+
+
+def _new_visual_box(name, size, pos, material):
+    """
+    visual-only box geom for a cabinet body
+    """
+    return new_geom(name=name, size=size, pos=pos, material=material, **_VIS_KW)
+
+
+# walls of a HousingCabinet, in the row order of its size and position arrays
+_HOUSING_WALLS = ("top", "bottom", "back", "left", "right")
+
+# door panel class for each panel_type
+_PANEL_CLASSES = {
+    "slab": SlabCabinetPanel,
+    None: SlabCabinetPanel,
+    "shaker": ShakerCabinetPanel,
+    "raised": RaisedCabinetPanel,
+    "divided_window": DividedWindowCabinetPanel,
+    "full_window": FullWindowedCabinetPanel,
+}
+_NO_PANEL = object()
+
+# geoms of the cabinet housing, in the row order of the arrays passed to set_geom_dimensions_batch
+_HOUSING_GEOMS = ("top", "bottom", "back", "left", "right", "shelf")
+_DRAWER_GEOMS = (
+    "top",
+    "bottom",
+    "back",
+    "left",
+    "right",
+    "inner_bottom",
+    "inner_back",
+    "inner_left",
+    "inner_right",
+)
+
+
+def _housing_dims(x, y, z, th):
+    """
+    sizes and positions of the housing geoms shared by single and hinge cabinets,
+    as rows of [sx, sy, sz, px, py, pz] in _HOUSING_GEOMS order
+    """
+    return np.array(
+        [
+            [x, y - th, th, 0, th, z - th],  # top
+            [x, y - th, th, 0, th, -z + th],  # bottom
+            [x - 2 * th, th, z - 2 * th, 0, y - th, 0],  # back
+            [th, y - th, z - 2 * th, -x + th, th, 0],  # left
+            [th, y - th, z - 2 * th, x - th, th, 0],  # right
+            [x - 2 * th, y - 0.05, th, 0, 0.05 - th, 0],  # shelf
+        ]
+    )
+
+
+class Cabinet(ProcGenFixture, abc.ABC):
     """
     Cabinet class. Procedurally defined with primitive geoms
 
@@ -52,6 +170,10 @@ class Cabinet(ProcGenFixture):
         texture (str): path to texture file
     """
 
+    # door joints read by get_door_state, without the cabinet name prefix
+    _door_joints = ()
+    _joint_addrs_sim = None
+
     def __init__(
         self,
         xml,
@@ -91,6 +213,11 @@ class Cabinet(ProcGenFixture):
         self.size = np.array(size)
         self.texture = texture
 
+        # half size and thickness, according to mujoco convention
+        # (size may hold None entries for a HingeCabinet, in which case it is left unset)
+        self._half_size = None if self.size.dtype == object else self.size * 0.5
+        self._half_th = thickness / 2
+
         # place and size each component
         self.geoms = None
         self._create_cab()
@@ -109,26 +236,17 @@ class Cabinet(ProcGenFixture):
         if self.texture is None:
             return
 
-        self.texture = xml_path_completion(
-            self.texture, root=robocasa.models.assets_root
-        )
+        self.texture = _resolve_texture(self.texture, robocasa.models.assets_root)
 
-        texture = find_elements(
-            self.root, tags="texture", attribs={"name": "tex"}, return_first=True
-        )
+        texture = self.root.find(".//texture[@name='tex']")
         tex_is_2d = texture.get("type", None) == "2d"
-        tex_name = get_texture_name_from_file(self.texture)
+        tex_name = _tex_name(self.texture)
         if tex_is_2d:
             tex_name += "_2d"
         texture.set("name", tex_name)
         texture.set("file", self.texture)
 
-        material = find_elements(
-            self.root,
-            tags="material",
-            attribs={"name": "{}_mat".format(self.name)},
-            return_first=True,
-        )
+        material = self.root.find(".//material[@name='{}_mat']".format(self.name))
         material.set("texture", tex_name)
 
     def get_reset_regions(self, env):
@@ -144,8 +262,51 @@ class Cabinet(ProcGenFixture):
             }
         }
 
+    @abc.abstractmethod
     def _create_cab(self):
-        raise NotImplementedError()
+        """
+        Creates the cabinet geometry. Implemented by each cabinet type
+        """
+
+    def _index_tree_by_name(self):
+        """
+        Builds a (tag, name) -> element index over the cabinet subtree in a single pass.
+        The first element in document order wins, matching find_elements(return_first=True)
+        """
+        self._name_index = dict()
+        for elem in self._obj.iter():
+            elem_name = elem.get("name")
+            if elem_name is not None:
+                self._name_index.setdefault((elem.tag, elem_name), elem)
+
+    def _get_elements_by_name(self, geom_names, body_names=None, joint_names=None):
+        """
+        Same as the base implementation, but resolves every name with a lookup into
+        an index built by one walk of the tree instead of one walk per name
+
+        Returns:
+            dicts for geoms, bodies, and joints, mapping names to elements
+        """
+        self._index_tree_by_name()
+        index = self._name_index
+        prefix = self.name + "_"
+
+        geoms = {
+            geom_name: [
+                index.get(("geom", prefix + geom_name + postfix))
+                for postfix in ["", "_visual"]
+            ]
+            for geom_name in geom_names
+        }
+        bodies = {
+            body_name: index.get(("body", prefix + body_name))
+            for body_name in body_names or []
+        }
+        joints = {
+            joint_name: index.get(("joint", prefix + joint_name))
+            for joint_name in joint_names or []
+        }
+        return geoms, bodies, joints
 
     def _add_door(
         self, w, h, th, pos, parent_body, handle_hpos, handle_vpos, door_name="door"
@@ -171,26 +332,19 @@ class Cabinet(ProcGenFixture):
             door_name (str): name of the door
 
         """
-        if self.panel_type == "slab" or self.panel_type is None:
-            panel_class = SlabCabinetPanel
-        elif self.panel_type == "shaker":
-            panel_class = ShakerCabinetPanel
-        elif self.panel_type == "raised":
-            panel_class = RaisedCabinetPanel
-        elif self.panel_type == "divided_window":
-            panel_class = DividedWindowCabinetPanel
-        elif self.panel_type == "full_window":
-            panel_class = FullWindowedCabinetPanel
-        elif self.panel_type == "no_panel":
-            # Partially implemented - size/pos of body will still assume panel in front
-            return
-        else:
+        panel_class = _PANEL_CLASSES.get(self.panel_type, _NO_PANEL)
+        if panel_class is _NO_PANEL:
+            if self.panel_type == "no_panel":
+                # Partially implemented - size/pos of body will still assume panel in front
+                return
             raise NotImplementedError()
         dg = self.door_gap
 
-        panel_config = deepcopy(self.panel_config)
-        panel_config["handle_hpos"] = handle_hpos
-        panel_config["handle_vpos"] = handle_vpos
+        panel_config = {
+            **self.panel_config,
+            "handle_hpos": handle_hpos,
+            "handle_vpos": handle_vpos,
+        }
 
         door = panel_class(
             size=[w - dg, th, h - dg],  # apply door gap to width and height
@@ -201,7 +355,7 @@ class Cabinet(ProcGenFixture):
             **panel_config,
         )
         door_elem = door.get_obj()
-        door_elem.set("pos", a2s(pos))
+        door_elem.set("pos", _a2s_cached(tuple(pos)))
 
         self.merge_assets(door)
         parent_body.append(door_elem)
@@ -212,6 +366,67 @@ class Cabinet(ProcGenFixture):
     def get_door_state(self, env):
         return {}
 
+    def _joint_qpos_addrs(self, sim, joints):
+        """
+        Gets the full names and qpos addresses of some of this cabinet's joints.
+        These are looked up once per sim and reused until the sim is recreated
+
+        Args:
+            sim (MjSim): simulation the addresses belong to
+
+            joints (tuple): joint names, without the cabinet name prefix
+
+        Returns:
+            2-tuple:
+                - (list): full name of each joint
+                - (np.array or list): qpos address of each joint. If any joint has multiple
+                    dofs, a list in which the (start, end) addresses are replaced by slices
+        """
+        if self._joint_addrs_sim is not sim:
+            self._joint_addrs = {}
+            self._joint_addrs_sim = sim
+
+        joints = tuple(joints)
+        if joints not in self._joint_addrs:
+            names = ["{}_{}".format(self.name, j) for j in joints]
+            addrs = [sim.model.get_joint_qpos_addr(n) for n in names]
+            if any(isinstance(addr, tuple) for addr in addrs):
+                # multi-dof joints have (start, end) addresses, read those as slices
+                addrs = [
+                    slice(*addr) if isinstance(addr, tuple) else addr for addr in addrs
+                ]
+            else:
+                addrs = np.array(addrs, dtype=np.intp)
+            self._joint_addrs[joints] = (names, addrs)
+        return self._joint_addrs[joints]
+
+    def _door_joint_qpos_addrs(self, sim):
+        """
+        Gets the qpos addresses of the door joints listed in self._door_joints
+
+        Args:
+            sim (MjSim): simulation the addresses belong to
+
+        Returns:
+            np.array: qpos address of each joint in self._door_joints
+        """
+        return self._joint_qpos_addrs(sim, self._door_joints)[1]
+
+    def _gather_joint_state(self, sim):
+        """
+        Reads the qpos of every joint in self._joints with a single gather from qpos
+
+        Args:
+            sim (MjSim): simulation to read from
+
+        Returns:
+            dict: maps joint names to joint values
+        """
+        names, addrs = self._joint_qpos_addrs(sim, self._joints)
+        if isinstance(addrs, np.ndarray):
+            return dict(zip(names, sim.data.qpos[addrs]))
+        return {name: sim.data.qpos[addr] for name, addr in zip(names, addrs)}
+
     @property
     def nat_lang(self):
         return "cabinet"
@@ -227,6 +442,8 @@ class SingleCabinet(Cabinet):
         name (str): name of the cabinet
     """
 
+    _door_joints = ("doorhinge",)
+
     def __init__(
         self,
         name="single_cab",
@@ -247,6 +464,9 @@ class SingleCabinet(Cabinet):
             **kwargs,
         )
 
+        self._handle_name = "{}_door_handle_handle".format(self.name)
+        self._door_name = "{}_hingedoor".format(self.name)
+
     def _get_cab_components(self):
         """
         Finds and returns all geoms, bodies, and joints used for single cabinets
@@ -254,7 +474,7 @@ class SingleCabinet(Cabinet):
         Returns:
             dicts for geoms, bodies, and joints, mapping names to elements
         """
-        geom_names = ["top", "bottom", "back", "right", "left", "shelf", "door"]
+        geom_names = _HOUSING_GEOMS + ("door",)
         body_names = ["hingedoor"]
         joint_names = ["doorhinge"]
 
@@ -267,40 +487,26 @@ class SingleCabinet(Cabinet):
         and interior bounding boxes.
         """
         # divide everything by 2 according to mujoco convention
-        x, y, z = [dim / 2 for dim in self.size]
-        th = self.thickness / 2
+        x, y, z = self._half_size.tolist()
+        th = self._half_th
 
         # get geoms, bodies, and joints
         # TODO: is adjusting the joint necessary?
         self.geoms, bodies, joints = self._get_cab_components()
 
         # cabinet housing
-        sizes = {
-            "top": [x, y - th, th],
-            "bottom": [x, y - th, th],
-            "back": [x - 2 * th, th, z - 2 * th],
-            "left": [th, y - th, z - 2 * th],
-            "right": [th, y - th, z - 2 * th],
-            "shelf": [x - 2 * th, y - 0.05, th],
-        }
-        positions = {
-            "top": [0, th, z - th],
-            "bottom": [0, th, -z + th],
-            "back": [0, y - th, 0],
-            "left": [-x + th, th, 0],
-            "right": [x - th, th, 0],
-            "shelf": [0, 0.05 - th, 0],
-        }
-        set_geom_dimensions(sizes, positions, self.geoms, rotated=True)
+        set_geom_dimensions_batch(
+            _HOUSING_GEOMS, _housing_dims(x, y, z, th), self.geoms, rotated=True
+        )
 
         # cabinet door bodies and joints
-        bodies["hingedoor"].set("pos", a2s([0, 0, 0]))
+        bodies["hingedoor"].set("pos", _a2s_cached((0, 0, 0)))
         # set joint position
         if self.orientation == "left":
-            joints["doorhinge"].set("pos", a2s([-x + th, -y, 0]))
-            joints["doorhinge"].set("range", a2s([-3.00, 0]))
+            joints["doorhinge"].set("pos", _a2s_cached((-x + th, -y, 0)))
+            joints["doorhinge"].set("range", _a2s_cached((-3.00, 0)))
         else:
-            joints["doorhinge"].set("pos", a2s([x - th, -y, 0]))
+            joints["doorhinge"].set("pos", _a2s_cached((x - th, -y, 0)))
 
         # create door
         door_pos = [0, -y + th, 0]
@@ -320,16 +526,7 @@ class SingleCabinet(Cabinet):
 
         # set sites
         self.set_bounds_sites(
-            {
-                "ext_p0": [-x, -y, -z],
-                "ext_px": [x, -y, -z],
-                "ext_py": [-x, y, -z],
-                "ext_pz": [-x, -y, z],
-                "int_p0": [-x + th * 2, -y + th * 2, -z + th * 2],
-                "int_px": [x - th * 2, -y + th * 2, -z + th * 2],
-                "int_py": [-x + th * 2, y - th * 2, -z + th * 2],
-                "int_pz": [-x + th * 2, -y + th * 2, z - th * 2],
-            }
+            _centered_bounds_sites((x, y, z), (x - th * 2, y - th * 2, z - th * 2))
         )
 
     def set_door_state(self, min, max, env, rng):
@@ -370,7 +567,8 @@ class SingleCabinet(Cabinet):
             dict: maps door name to a percentage of how open the door is
         """
         sim = env.sim
-        hinge_qpos = sim.data.qpos[sim.model.joint_name2id(f"{self.name}_doorhinge")]
+        (hinge_addr,) = self._door_joint_qpos_addrs(sim)
+        hinge_qpos = sim.data.qpos[hinge_addr]
         sign = -1 if self.orientation == "left" else 1
         hinge_qpos = hinge_qpos * sign
 
@@ -383,11 +581,11 @@ class SingleCabinet(Cabinet):
 
     @property
     def handle_name(self):
-        return "{}_door_handle_handle".format(self.name)
+        return self._handle_name
 
     @property
     def door_name(self):
-        return "{}_hingedoor".format(self.name)
+        return self._door_name
 
 
 class HingeCabinet(Cabinet):
@@ -398,6 +596,8 @@ class HingeCabinet(Cabinet):
         name (str): name of the cabinet
     """
 
+    _door_joints = ("rightdoorhinge", "leftdoorhinge")
+
     def __init__(
         self,
         name="hinge_cab",
@@ -415,6 +615,9 @@ class HingeCabinet(Cabinet):
             **kwargs,
         )
 
+        self._left_handle_name = "{}_left_door_handle_handle".format(self.name)
+        self._right_handle_name = "{}_right_door_handle_handle".format(self.name)
+
     def _get_cab_components(self):
         """
         Finds and returns all geoms, bodies, and joints used for single cabinets
@@ -423,14 +626,7 @@ class HingeCabinet(Cabinet):
             dicts for geoms, bodies, and joints, mapping names to elements
         """
 
-        geom_names = [
-            "top",
-            "bottom",
-            "back",
-            "right",
-            "left",
-            "shelf",
-        ]
+        geom_names = _HOUSING_GEOMS
         body_names = ["hingeleftdoor", "hingerightdoor"]
         joint_names = ["leftdoorhinge", "rightdoorhinge"]
 
@@ -443,37 +639,26 @@ class HingeCabinet(Cabinet):
         and interior bounding boxes.
         """
         # divide sizes by two according to mujoco conventions
-        x, y, z = [dim / 2 if dim is not None else None for dim in self.size]
-        th = self.thickness / 2
+        if self._half_size is None:
+            x, y, z = [dim / 2 if dim is not None else None for dim in self.size]
+        else:
+            x, y, z = self._half_size.tolist()
+        th = self._half_th
 
         self.geoms, bodies, joints = self._get_cab_components()
 
         # set bodies positions
-        bodies["hingeleftdoor"].set("pos", a2s([0, 0, 0]))
-        bodies["hingerightdoor"].set("pos", a2s([0, 0, 0]))
+        bodies["hingeleftdoor"].set("pos", _a2s_cached((0, 0, 0)))
+        bodies["hingerightdoor"].set("pos", _a2s_cached((0, 0, 0)))
 
         # set joint positions
-        joints["leftdoorhinge"].set("pos", a2s([-x + th, -y, 0]))
-        joints["rightdoorhinge"].set("pos", a2s([x - th, -y, 0]))
-
-        # positions
-        positions = {
-            "top": [0, th, z - th],
-            "bottom": [0, th, -z + th],
-            "back": [0, y - th, 0],
-            "left": [-x + th, th, 0],
-            "right": [x - th, th, 0],
-            "shelf": [0, 0.05 - th, 0],
-        }
-        sizes = {
-            "top": [x, y - th, th],
-            "bottom": [x, y - th, th],
-            "back": [x - 2 * th, th, z - 2 * th],
-            "left": [th, y - th, z - 2 * th],
-            "right": [th, y - th, z - 2 * th],
-            "shelf": [x - 2 * th, y - 0.05, th],
-        }
-        set_geom_dimensions(sizes, positions, self.geoms, rotated=True)
+        joints["leftdoorhinge"].set("pos", _a2s_cached((-x + th, -y, 0)))
+        joints["rightdoorhinge"].set("pos", _a2s_cached((x - th, -y, 0)))
+
+        # sizes and positions
+        set_geom_dimensions_batch(
+            _HOUSING_GEOMS, _housing_dims(x, y, z, th), self.geoms, rotated=True
+        )
 
         # add doors
         door_x_positions = {"left": -x / 2, "right": x / 2}
@@ -493,16 +678,7 @@ class HingeCabinet(Cabinet):
 
         # set sites
         self.set_bounds_sites(
-            {
-                "ext_p0": [-x, -y, -z],
-                "ext_px": [x, -y, -z],
-                "ext_py": [-x, y, -z],
-                "ext_pz": [-x, -y, z],
-                "int_p0": [-x + th * 2, -y + th * 2, -z + th * 2],
-                "int_px": [x - th * 2, -y + th * 2, -z + th * 2],
-                "int_py": [-x + th * 2, y - th * 2, -z + th * 2],
-                "int_pz": [-x + th * 2, -y + th * 2, z - th * 2],
-            }
+            _centered_bounds_sites((x, y, z), (x - th * 2, y - th * 2, z - th * 2))
         )
 
     def get_state(self, sim):
@@ -514,12 +690,7 @@ class HingeCabinet(Cabinet):
             dict: maps joint names to joint values
         """
         # angle of two door joints
-        state = dict()
-        for j in self._joints:
-            name = "{}_{}".format(self.name, j)
-            addr = sim.model.get_joint_qpos_addr(name)
-            state[name] = sim.data.qpos[addr]
-        return state
+        return self._gather_joint_state(sim)
 
     def set_door_state(self, min, max, env, rng):
         """
@@ -560,12 +731,9 @@ class HingeCabinet(Cabinet):
             dict: maps door names to a percentage of how open they are
         """
         sim = env.sim
-        right_hinge_qpos = sim.data.qpos[
-            sim.model.joint_name2id(f"{self.name}_rightdoorhinge")
-        ]
-        left_hinge_qpos = -sim.data.qpos[
-            sim.model.joint_name2id(f"{self.name}_leftdoorhinge")
-        ]
+        right_addr, left_addr = self._door_joint_qpos_addrs(sim)
+        right_hinge_qpos = sim.data.qpos[right_addr]
+        left_hinge_qpos = -sim.data.qpos[left_addr]
 
         # convert to percentages
         left_door = OU.normalize_joint_value(
@@ -582,17 +750,38 @@ class HingeCabinet(Cabinet):
 
     @property
     def left_handle_name(self):
-        return "{}_left_door_handle_handle".format(self.name)
+        return self._left_handle_name
 
     @property
     def right_handle_name(self):
-        return "{}_right_door_handle_handle".format(self.name)
+        return self._right_handle_name
 
 
 # 在类外部定义常量
 SHELF_SECTIONS = ["section_1", "section_2", "section_3", "section_4"]
 
 
+@jit_decorator
+def _build_reset_grid(x, y, z_positions, th, section_width, n_sections):
+    """
+    计算每个架子每个区域的 offset (N, 3) 和 size (N, 2)，按架子、区域的顺序排列，
+    N = len(z_positions) * n_sections
+    """
+    n = z_positions.shape[0] * n_sections
+    offsets = np.zeros((n, 3))
+    sizes = np.empty((n, 2))
+    k = 0
+    for i in range(z_positions.shape[0]):
+        for j in range(n_sections):
+            # 计算x位置：从左到右
+            offsets[k, 0] = -x / 2 + th + j * section_width + section_width / 2
+            offsets[k, 2] = z_positions[i] + th
+            sizes[k, 0] = section_width * 0.8
+            sizes[k, 1] = y - 2 * th
+            k += 1
+    return offsets, sizes
+
+
 class OpenCabinet(Cabinet):
     """
     Creates a OpenCabinet object which is a cabinet with open shelves
@@ -647,89 +836,80 @@ class OpenCabinet(Cabinet):
             - z / 2
         )
 
-        shelf_size = [x, y, th]
+        shelf_positions = np.zeros((self.num_shelves, 3))
+        shelf_positions[:, 2] = self.shelf_z_positions
+        shelf_size = (x, y, th)
 
         # 创建架子
-        for i in range(self.num_shelves):
-            shelf_pos = [0, 0, self.shelf_z_positions[i]]
-            shelf = CabinetShelf(
+        shelves = [
+            CabinetShelf(
                 size=shelf_size,
-                pos=shelf_pos,
+                pos=shelf_positions[i],
                 name="{}_shelf_{}".format(self.name, i),
                 texture=self.texture,
             )
-            self.shelves.append(shelf)
+            for i in range(self.num_shelves)
+        ]
+        self.shelves.extend(shelves)
 
-            # merge shelves
+        # merge shelves
+        for shelf in shelves:
             self.merge_assets(shelf)
-            shelf_elem = shelf.get_obj()
-            self.get_obj().append(shelf_elem)
+        self.get_obj().extend([shelf.get_obj() for shelf in shelves])
 
         self.set_bounds_sites(
-            {
-                "ext_p0": [-x, -y, -z],
-                "ext_px": [x, -y, -z],
-                "ext_py": [-x, y, -z],
-                "ext_pz": [-x, -y, z],
-                "int_p0": [-x + th * 2, -y + th * 2, -z + th * 2],
-                "int_px": [x - th * 2, -y + th * 2, -z + th * 2],
-                "int_py": [-x + th * 2, y - th * 2, -z + th * 2],
-                "int_pz": [-x + th * 2, -y + th * 2, z - th * 2],
-            }
+            _centered_bounds_sites((x, y, z), (x - th * 2, y - th * 2, z - th * 2))
         )
 
+        # 架子的重置区域在创建后不再变化，预先计算
+        self._reset_regions = self._compute_reset_regions()
+
     def get_reset_regions(self, env):
-        """获取所有架子的重置区域"""
-        x, y, z = self.size
+        """获取所有架子的重置区域（在 _create_cab 中预先计算）"""
+        return self._reset_regions
+
+    def _compute_reset_regions(self):
+        """计算所有架子的重置区域，只依赖 size、thickness 和 shelf_z_positions"""
+        x, y, z = self.size.tolist()
         th = self.thickness
 
         # 计算每个区域的宽度
         section_width = (x - 2 * th) / len(SHELF_SECTIONS)
 
-        regions = {}
-        # 为每个架子的每个区域创建放置区域
-        for i, z_pos in enumerate(self.shelf_z_positions):
-            for j, section in enumerate(SHELF_SECTIONS):
-                # 计算x位置：从左到右
-                x_offset = -x / 2 + th + (j * section_width) + (section_width / 2)
-
-                regions[f"shelf_{i}_{section}"] = {
-                    "offset": (x_offset, 0, z_pos + th),
-                    "size": (section_width * 0.8, y - 2 * th),
-                }
-
-        return regions
+        offsets, sizes = _build_reset_grid(
+            x,
+            y,
+            np.asarray(self.shelf_z_positions, dtype=np.float64),
+            th,
+            section_width,
+            len(SHELF_SECTIONS),
+        )
+        keys = [
+            f"shelf_{i}_{section}"
+            for i in range(len(self.shelf_z_positions))
+            for section in SHELF_SECTIONS
+        ]
+        return {
+            key: {"offset": tuple(offset), "size": tuple(size)}
+            for key, offset, size in zip(keys, offsets.tolist(), sizes.tolist())
+        }
 
     def sample_reset_region(self, env, shelf_index=None, **kwargs):
         """采样一个重置区域"""
         regions = self.get_reset_regions(env)
 
-        # 检查kwargs的结构
-        if "sample_region_kwargs" in kwargs:
-            # print(f"Debug - Found sample_region_kwargs: {kwargs['sample_region_kwargs']}")
-            region_kwargs = kwargs["sample_region_kwargs"]
-            shelf_index = region_kwargs.get("shelf_index", 0)
-            section = region_kwargs.get("section", "section_1")
-        elif "section" in kwargs:  # 添加这个分支来处理直接的section参数
-            # print(f"Debug - Found direct section: {kwargs['section']}")
-            shelf_index = kwargs.get("shelf_index", 0)
-            section = kwargs["section"]
-        else:
-            # print("Debug - No section information found, using defaults")
-            shelf_index = shelf_index if shelf_index is not None else 0
-            section = "section_1"
-
-        # print(f"Debug - Using shelf_index: {shelf_index}, section: {section}")
+        # 区域参数可以放在 sample_region_kwargs 中，也可以直接传入
+        region_kwargs = kwargs.get("sample_region_kwargs") or kwargs
+        shelf_index = region_kwargs.get("shelf_index", shelf_index or 0)
+        section = region_kwargs.get("section", "section_1")
 
-        # 构建区域键
-        region_key = f"shelf_{shelf_index}_{section}"
-
-        if region_key in regions:
-            # print(f"Debug - Using region: {region_key}")
-            return regions[region_key]
-
-        print(f"Debug - Region {region_key} not found, using default")
-        return regions["shelf_0_section_1"]
+        region = regions.get(f"shelf_{shelf_index}_{section}")
+        if region is None:
+            logger.warning(
+                "Region shelf_%s_%s not found, using default", shelf_index, section
+            )
+            region = regions["shelf_0_section_1"]
+        return region
 
     @property
     def nat_lang(self):
@@ -746,6 +926,8 @@ class Drawer(Cabinet):
         handle_config (dict): configuration for handle. contains keyword arguments for handle class
     """
 
+    _door_joints = ("slidejoint",)
+
     def __init__(
         self,
         name="drawer",
@@ -769,23 +951,15 @@ class Drawer(Cabinet):
             **kwargs,
         )
 
+        self._handle_name = "{}_door_handle_handle".format(self.name)
+
     def _get_cab_components(self):
         """
         Finds and returns all geoms, bodies, and joints used for drawers
         returns:
             dicts for geoms, bodies, and joints, mapping names to elements
         """
-        geom_names = [
-            "top",
-            "bottom",
-            "back",
-            "right",
-            "left",
-            "inner_bottom",
-            "inner_back",
-            "inner_right",
-            "inner_left",
-        ]
+        geom_names = _DRAWER_GEOMS
         body_names = ["inner_box"]
         joint_names = ["slidejoint"]
 
@@ -797,8 +971,8 @@ class Drawer(Cabinet):
         creating the door class. This also involves calculating the exterior and interior bounding boxes.
         """
         # divide everything by 2 according to mujoco convention
-        x, y, z = [dim / 2 for dim in self.size]
-        th = self.thickness / 2
+        x, y, z = self._half_size.tolist()
+        th = self._half_th
 
         self.geoms, bodies, joints = self._get_cab_components()
 
@@ -810,35 +984,27 @@ class Drawer(Cabinet):
         iy = y - 2 * th
         iz = z - 2 * th - 0.001  # inner box z
 
-        sizes = {
-            "top": [x, y - th, th],
-            "bottom": [x, y - th, th],
-            "back": [x - 2 * th, th, z - 2 * th],
-            "left": [th, y - th, z - 2 * th],
-            "right": [th, y - th, z - 2 * th],
-            "inner_bottom": [ix, iy, th],
-            "inner_back": [ix - 2 * th, th, iz - 2 * th],
-            "inner_left": [th, iy, iz - 2 * th],
-            "inner_right": [th, iy, iz - 2 * th],
-        }
-        positions = {
-            "top": [0, th, z - th],
-            "bottom": [0, th, -z + th],
-            "back": [0, y - th, 0],
-            "left": [-x + th, th, 0],
-            "right": [x - th, th, 0],
-            "inner_bottom": [0, 0, -iz + th],
-            "inner_back": [0, iy - th, 0],
-            "inner_left": [-ix + th, 0, 0],
-            "inner_right": [ix - th, 0, 0],
-        }
-        set_geom_dimensions(sizes, positions, self.geoms, rotated=True)
+        # rows of [sx, sy, sz, px, py, pz] in _DRAWER_GEOMS order
+        dims = np.array(
+            [
+                [x, y - th, th, 0, th, z - th],  # top
+                [x, y - th, th, 0, th, -z + th],  # bottom
+                [x - 2 * th, th, z - 2 * th, 0, y - th, 0],  # back
+                [th, y - th, z - 2 * th, -x + th, th, 0],  # left
+                [th, y - th, z - 2 * th, x - th, th, 0],  # right
+                [ix, iy, th, 0, 0, -iz + th],  # inner_bottom
+                [ix - 2 * th, th, iz - 2 * th, 0, iy - th, 0],  # inner_back
+                [th, iy, iz - 2 * th, -ix + th, 0, 0],  # inner_left
+                [th, iy, iz - 2 * th, ix - th, 0, 0],  # inner_right
+            ]
+        )
+        set_geom_dimensions_batch(_DRAWER_GEOMS, dims, self.geoms, rotated=True)
 
         # door body and joints
-        bodies["inner_box"].set("pos", a2s([0, 0, 0]))
+        bodies["inner_box"].set("pos", _a2s_cached((0, 0, 0)))
         # set joint position
-        joints["slidejoint"].set("pos", a2s([0, -y, 0]))
-        joints["slidejoint"].set("range", a2s([-y * 2, 0]))
+        joints["slidejoint"].set("pos", _a2s_cached((0, -y, 0)))
+        joints["slidejoint"].set("range", _a2s_cached((-y * 2, 0)))
 
         # create door
         door_w, door_h, door_th = x * 2, z * 2, th * 2  # multiply by 2 to set full size
@@ -855,10 +1021,7 @@ class Drawer(Cabinet):
 
         self.set_bounds_sites(
             {
-                "ext_p0": [-x, -y, -z],
-                "ext_px": [x, -y, -z],
-                "ext_py": [-x, y, -z],
-                "ext_pz": [-x, -y, z],
+                **dict(zip(_EXT_SITE_NAMES, (_BOUNDS_SIGNS * (x, y, z)).tolist())),
                 "int_p0": [-ix + 2 * th, -iy, -iz + 2 * th],
                 "int_px": [ix - 2 * th, -iy, -iz + 2 * th],
                 "int_py": [-ix + 2 * th, iy - 2 * th, -iz + 2 * th],
@@ -924,7 +1087,8 @@ class Drawer(Cabinet):
             dict: maps door name to a percentage of how open the door is
         """
         sim = env.sim
-        hinge_qpos = sim.data.qpos[sim.model.joint_name2id(f"{self.name}_slidejoint")]
+        (slide_addr,) = self._door_joint_qpos_addrs(sim)
+        hinge_qpos = sim.data.qpos[slide_addr]
         sign = -1
         hinge_qpos = hinge_qpos * sign
 
@@ -939,7 +1103,7 @@ class Drawer(Cabinet):
 
     @property
     def handle_name(self):
-        return "{}_door_handle_handle".format(self.name)
+        return self._handle_name
 
 
 class PanelCabinet(Cabinet):
@@ -986,33 +1150,16 @@ class PanelCabinet(Cabinet):
         Creates the panel cabinet. This involves setting the sizes and positions for door, and
         if solid_body is True, creating a solid body for the cabinet behind the panel.
         """
-        x, y, z = [dim / 2 for dim in self.size]
-        th = self.thickness / 2
+        x, y, z = self._half_size.tolist()
+        th = self._half_th
 
         if self.solid_body:
             geom_name = self._name + "_body"
             size = [x, y - th, z]
             pos = [0, th, 0]
-            g = new_geom(
-                name=geom_name,
-                type="box",
-                size=size,
-                pos=pos,
-                group=0,
-                density=10,
-                rgba="0.5 0 0 1",
-            )
-            g_vis = new_geom(
-                name=geom_name + "_visual",
-                type="box",
-                size=size,
-                pos=pos,
-                group=1,
-                material=self._name + "_mat",
-                density=10,
-                conaffinity=0,
-                contype=0,
-                mass=1e-8,
+            g = _new_collision_box(geom_name, size, pos)
+            g_vis = _new_visual_box(
+                geom_name + "_visual", size, pos, material=self._name + "_mat"
             )
             self._obj.append(g)
             self._obj.append(g_vis)
@@ -1032,12 +1179,108 @@ class PanelCabinet(Cabinet):
 
     def get_state(self, sim):
         # angle of two door joints
-        state = dict()
-        for j in self._joints:
-            name = "{}_{}".format(self.name, j)
-            addr = sim.model.get_joint_qpos_addr(name)
-            state[name] = sim.data.qpos[addr]
-        return state
+        return self._gather_joint_state(sim)
+
+
+# status codes returned by _resolve_housing_padding
+_PADDING_OK = 0
+_PADDING_UNDERSPECIFIED = 1
+_PADDING_MISMATCH = 2
+
+
+@jit_decorator
+def _resolve_housing_padding(size, padding, interior_size):
+    """
+    Fills in the unspecified (NaN) entries of a housing cabinet's size (3,) and padding (3, 2)
+    in place so that size = padding[-] + interior size + padding[+] in every dimension
+
+    Returns:
+        int: _PADDING_OK, or the status code of the first dimension that could not be resolved
+    """
+    for d in range(3):
+        if np.isnan(size[d]):
+            if np.isnan(padding[d, 0]) or np.isnan(padding[d, 1]):
+                return _PADDING_UNDERSPECIFIED
+            size[d] = padding[d, 0] + padding[d, 1] + interior_size[d]
+        elif np.isnan(padding[d, 0]) and np.isnan(padding[d, 1]):
+            padding[d, 0] = (size[d] - interior_size[d]) / 2
+            padding[d, 1] = padding[d, 0]
+        elif np.isnan(padding[d, 0]):
+            padding[d, 0] = size[d] - interior_size[d] - padding[d, 1]
+        elif np.isnan(padding[d, 1]):
+            padding[d, 1] = size[d] - interior_size[d] - padding[d, 0]
+        elif size[d] != padding[d, 0] + padding[d, 1] + interior_size[d]:
+            return _PADDING_MISMATCH
+    return _PADDING_OK
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_housing_layout(half_size, padding):
+    """
+    Computes the wall geoms and bounds sites of a housing cabinet. Housing cabinets of the
+    same size and padding recur across scenes, so the layout is memoized on these inputs.
+    The interior object's size is already folded into the resolved padding
+
+    Args:
+        half_size (tuple): half size of the cabinet (x, y, z), according to mujoco conventions
+
+        padding (tuple): resolved padding ((-x, x), (-y, y), (-z, z))
+
+    Returns:
+        2-tuple:
+            - (tuple): (name, size, pos) of each wall with a positive size
+            - (tuple): (name, pos) of each exterior and interior bounds site
+    """
+    x, y, z = half_size
+
+    # half paddings, [[-x, x], [-y, y], [-z, z]]
+    (px0, px1), (py0, py1), (pz0, pz1) = (
+        np.asarray(padding, dtype=np.float64) * 0.5
+    ).tolist()
+
+    # sizes and positions of 5 walls according to padding, rows in _HOUSING_WALLS order
+    sizes = np.array(
+        [
+            [x, y - py1, pz1],  # top
+            [x, y - py1, pz0],  # bottom
+            [x, py1, z],  # back
+            [px0, y - py1, z - (pz0 + pz1)],  # left
+            [px1, y - py1, z - (pz0 + pz1)],  # right
+        ]
+    )
+    positions = np.array(
+        [
+            [0, -py1, z - pz1],  # top
+            [0, -py1, -z + pz0],  # bottom
+            [0, y - py1, 0],  # back
+            [-x + px0, -py1, 0],  # left
+            [x - px1, -py1, 0],  # right
+        ]
+    )
+
+    # remove walls with size <= 0
+    keep = (sizes > 0).all(axis=1)
+    walls = tuple(
+        (geom, tuple(size), tuple(pos))
+        for geom, kept, size, pos in zip(
+            _HOUSING_WALLS, keep.tolist(), sizes.tolist(), positions.tolist()
+        )
+        if kept
+    )
+
+    # exterior corners from the half size, interior corners
+    # inset by the padding on each side ([-x, x], [-y, y], [-z, z])
+    hs = np.array(half_size)
+    pad = np.asarray(padding, dtype=np.float64)
+    ext = _BOUNDS_SIGNS * hs
+    interior = np.where(_BOUNDS_SIGNS > 0, hs - pad[:, 1], -hs + pad[:, 0])
+    bounds = tuple(
+        (name, tuple(pos))
+        for name, pos in zip(
+            _EXT_SITE_NAMES + _INT_SITE_NAMES, np.vstack([ext, interior]).tolist()
+        )
+    )
+    return walls, bounds
 
 
 class HousingCabinet(Cabinet):
@@ -1073,42 +1316,50 @@ class HousingCabinet(Cabinet):
             None  # initially set to None for superclass initialization, set later
         )
 
-        # Parse size and padding input
+        # Parse size and padding input, unspecified values are NaN
         if size is None and padding is None:
             raise ValueError("Must specify size or padding for housing cabinet")
-        elif size is None:
-            size = [None] * 3
-        elif padding is None:
-            padding = [[None] * 2 for _ in range(3)]
-
-        padding = [[None, None] if p is None else p for p in padding]
-
-        for d in range(3):
-            if size[d] is None:
-                if padding[d][0] is None or padding[d][1] is None:
-                    raise ValueError(
-                        "If size is not specified for a dimension, both padding values must be"
-                    )
-                else:
-                    size[d] = sum(padding[d]) + interior_obj.size[d]
-            elif padding[d][0] is None and padding[d][1] is None:
-                padding[d][0] = padding[d][1] = (size[d] - interior_obj.size[d]) / 2
-            elif padding[d][0] is None:
-                padding[d][0] = size[d] - interior_obj.size[d] - padding[d][1]
-            elif padding[d][1] is None:
-                padding[d][1] = size[d] - interior_obj.size[d] - padding[d][0]
-            else:
-                # Everything is specified, so check that sizes match exactly
-                assert size[d] == sum(padding[d]) + interior_obj.size[d]
-
-            # Round small fp errors to 0
-            padding[d] = [i if abs(i) > 0.000001 else 0 for i in padding[d]]
-
-            # Allow negative front padding for object to stick out further
-            if size[d] < 0 or padding[d][1] < 0 or (d != 1 and padding[d][0] < 0):
-                raise ValueError("Negative cab size or padding")
 
+        size_arr = np.full(3, np.nan)
+        if size is not None:
+            for d, dim in enumerate(size):
+                if dim is not None:
+                    size_arr[d] = dim
+        padding_arr = np.full((3, 2), np.nan)
+        if padding is not None:
+            for d, pad in enumerate(padding):
+                for side in range(2):
+                    if pad is not None and pad[side] is not None:
+                        padding_arr[d, side] = pad[side]
+
+        status = _resolve_housing_padding(
+            size_arr, padding_arr, np.asarray(interior_obj.size, dtype=np.float64)
+        )
+        if status == _PADDING_UNDERSPECIFIED:
+            raise ValueError(
+                "If size is not specified for a dimension, both padding values must be"
+            )
+        # Everything is specified, so check that sizes match exactly
+        assert status != _PADDING_MISMATCH
+
+        # Round small fp errors to 0
+        padding_arr = np.where(np.abs(padding_arr) > 0.000001, padding_arr, 0.0)
+
+        # Allow negative front padding for object to stick out further
+        if (
+            size_arr.min() < 0
+            or padding_arr[:, 1].min() < 0
+            or padding_arr[[0, 2], 0].min() < 0
+        ):
+            raise ValueError("Negative cab size or padding")
+
+        size = size_arr.tolist()
+        padding = padding_arr.tolist()
         self.padding = padding
+        # offset of the interior object from the cabinet center, fixed once padding is resolved
+        self._padding_delta = np.asarray(
+            [(p[0] - p[1]) * 0.5 for p in padding], dtype=np.float64
+        )
         super().__init__(
             xml=xml,
             name=name,
@@ -1138,112 +1389,26 @@ class HousingCabinet(Cabinet):
         """
 
         # calculate and set the position of sink
-        interior_origin = np.array(
-            [
-                self.pos[0] + (self.padding[0][0] - self.padding[0][1]) / 2,
-                self.pos[1] + (self.padding[1][0] - self.padding[1][1]) / 2,
-                self.pos[2] + (self.padding[2][0] - self.padding[2][1]) / 2,
-            ]
-        )
-
-        self.interior_obj.set_origin(interior_origin)
+        self.interior_obj.set_origin(self.pos + self._padding_delta)
 
     def _create_cab(self):
         """
         Creates the housing cabinet. This involves setting the sizes and positions for the sourrounding walls of the
         housing cabinet, and setting exterior and interior bounding box sites.
         """
-        # divide sizes by two according to mujoco conventions
-        x, y, z = [dim / 2 for dim in self.size]
-
-        # positions of 5 walls according to padding
-        positions = {
-            "top": [0, -self.padding[1][1] / 2, z - self.padding[2][1] / 2],
-            "bottom": [0, -self.padding[1][1] / 2, -z + self.padding[2][0] / 2],
-            "back": [0, y - self.padding[1][1] / 2, 0],
-            "left": [-x + self.padding[0][0] / 2, -self.padding[1][1] / 2, 0],
-            "right": [x - self.padding[0][1] / 2, -self.padding[1][1] / 2, 0],
-        }
-        # sizes of 5 walls according to padding
-        sizes = {
-            "top": [x, y - self.padding[1][1] / 2, self.padding[2][1] / 2],
-            "bottom": [x, y - self.padding[1][1] / 2, self.padding[2][0] / 2],
-            "back": [x, self.padding[1][1] / 2, z],
-            "left": [
-                self.padding[0][0] / 2,
-                y - self.padding[1][1] / 2,
-                z - sum(self.padding[2]) / 2,
-            ],
-            "right": [
-                self.padding[0][1] / 2,
-                y - self.padding[1][1] / 2,
-                z - sum(self.padding[2]) / 2,
-            ],
-        }
-
-        # remove walls with size <= 0
-        sizes = {
-            geom: np.array(size)
-            for geom, size in sizes.items()
-            if all([d > 0 for d in size])
-        }
-        positions = {
-            geom: np.array(pos) for geom, pos in positions.items() if geom in sizes
-        }
+        walls, bounds = _compute_housing_layout(
+            tuple(self._half_size.tolist()), tuple(map(tuple, self.padding))
+        )
 
         # Add geoms to xml
-        for geom in sizes.keys():
+        for geom, size, pos in walls:
             geom_name = self._name + "_" + geom
-            g = new_geom(
-                name=geom_name,
-                type="box",
-                size=sizes[geom],
-                pos=positions[geom],
-                group=0,
-                density=10,
-                rgba="0.5 0 0 1",
-            )
-            g_vis = new_geom(
-                name=geom_name + "_visual",
-                type="box",
-                size=sizes[geom],
-                pos=positions[geom],
-                group=1,
-                material=self._name + "_mat",
-                density=10,
-                conaffinity=0,
-                contype=0,
-                mass=1e-8,
+            g = _new_collision_box(geom_name, size, pos)
+            g_vis = _new_visual_box(
+                geom_name + "_visual", size, pos, material=self._name + "_mat"
             )
             self._obj.append(g)
             self._obj.append(g_vis)
 
         # set sites
-        self.set_bounds_sites(
-            {
-                "ext_p0": [-x, -y, -z],
-                "ext_px": [x, -y, -z],
-                "ext_py": [-x, y, -z],
-                "ext_pz": [-x, -y, z],
-                "int_p0": [
-                    -x + self.padding[0][0],
-                    -y + self.padding[1][0],
-                    -z + self.padding[2][0],
-                ],
-                "int_px": [
-                    x - self.padding[0][1],
-                    -y + self.padding[1][0],
-                    -z + self.padding[2][0],
-                ],
-                "int_py": [
-                    -x + self.padding[0][0],
-                    y - self.padding[1][1],
-                    -z + self.padding[2][0],
-                ],
-                "int_pz": [
-                    -x + self.padding[0][0],
-                    -y + self.padding[1][0],
-                    z - self.padding[2][1],
-                ],
-            }
-        )
+        self.set_bounds_sites(dict(bounds))
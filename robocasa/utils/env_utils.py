@@ -6,6 +6,7 @@ from robocasa.utils.dataset_registry import (
 from robocasa.scripts.playback_dataset import get_env_metadata_from_dataset
 from robosuite.controllers import load_composite_controller_config
 import os
+from concurrent.futures import ThreadPoolExecutor
 import robosuite
 import imageio
 import numpy as np
@@ -65,6 +66,85 @@ def create_env(
     return env
 
 
+class EnvPool:
+    """
+    A fixed set of environments that are stepped in parallel on a shared thread pool.
+
+    Each environment owns its own MuJoCo model and data, so the environments can be
+    reset and stepped concurrently without any locking.
+
+    Args:
+        envs (list): environments to hold in the pool
+
+        max_workers (int): number of worker threads. Defaults to min(len(envs), cpu count)
+    """
+
+    def __init__(self, envs, max_workers=None):
+        self.envs = list(envs)
+        if max_workers is None:
+            max_workers = min(len(self.envs), os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __len__(self):
+        return len(self.envs)
+
+    @property
+    def action_spec(self):
+        return self.envs[0].action_spec
+
+    def reset(self):
+        """
+        Resets all environments.
+
+        Returns:
+            list: observations, one per environment
+        """
+        return list(self._executor.map(lambda env: env.reset(), self.envs))
+
+    def step(self, actions):
+        """
+        Steps every environment with its own action.
+
+        Args:
+            actions (np.ndarray): array of shape (num_envs, action_dim)
+
+        Returns:
+            list: (obs, reward, done, info) tuples, one per environment
+        """
+        assert len(actions) == len(self.envs)
+        return list(self._executor.map(lambda env, a: env.step(a), self.envs, actions))
+
+    def close(self):
+        self._executor.shutdown()
+        for env in self.envs:
+            env.close()
+
+
+def make_env_pool(num_envs, seed=None, max_workers=None, **env_kwargs):
+    """
+    Creates @num_envs environments with robosuite.make and wraps them in an EnvPool.
+
+    Args:
+        num_envs (int): number of environments to create
+
+        seed (int): if specified, environment i is seeded with seed + i
+
+        max_workers (int): number of worker threads used by the pool
+
+        env_kwargs (dict): keyword arguments passed to robosuite.make
+
+    Returns:
+        EnvPool: pool holding the created environments
+    """
+    envs = []
+    for i in range(num_envs):
+        kwargs = dict(env_kwargs)
+        if seed is not None:
+            kwargs["seed"] = seed + i
+        envs.append(robosuite.make(**kwargs))
+    return EnvPool(envs, max_workers=max_workers)
+
+
 def run_random_rollouts(env, num_rollouts, num_steps, video_path=None):
     video_writer = None
     if video_path is not None:
@@ -92,6 +92,40 @@ def set_geom_dimensions(sizes, positions, geoms, rotated=False):
             geom.set("size", array_to_string(sizes[side]))
 
 
+def set_geom_dimensions_batch(sides, dims, geoms, rotated=False):
+    """
+    set the dimensions of geoms in a fixture from a single array. equivalent to set_geom_dimensions,
+    but sizes and positions are given as rows of one array instead of two dictionaries of lists
+
+    Args:
+        sides (tuple): names of the sides, one for each row of dims
+
+        dims (np.array): (N, 6) array of [sx, sy, sz, px, py, pz] for each side
+
+        geoms (dict): dictionary of geoms for each side
+
+        rotated (bool): whether the fixture is rotated. Fixture may be rotated to make texture appear uniform
+                        due to mujoco texture conventions
+    """
+    dims = np.array(dims, dtype=float)
+    if rotated:
+        # rotation trick to make texture appear uniform
+        # see .xml file
+        for i, side in enumerate(sides):
+            if "door" in side or "trim" in side:
+                dims[i, [1, 2]] = dims[i, [2, 1]]
+
+    # set sizes and positions of all geoms
+    for side, row in zip(sides, dims.tolist()):
+        size = " ".join(map(repr, row[:3]))
+        pos = " ".join(map(repr, row[3:]))
+        for geom in geoms[side]:
+            if geom is None:
+                raise ValueError("Did not find geom:", side)
+            geom.set("pos", pos)
+            geom.set("size", size)
+
+
 def get_rel_transform(fixture_A, fixture_B):
     """
     Gets fixture_B's position and rotation relative to fixture_A's frame
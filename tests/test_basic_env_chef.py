@@ -0,0 +1,226 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+from lxml import etree as ET
+from robosuite.models.objects import BoxObject
+
+from robocasa.environments.kitchen.single_stage import (
+    _basicEnv_chef,
+    _chef_kernels_src,
+)
+from robocasa.environments.kitchen.single_stage._basicEnv_chef import BasicEnvChef
+from robocasa.models.fixtures import Fixture
+
+
+class TestPlaceOnUtensils(unittest.TestCase):
+    def make_env(self, names):
+        qpos = np.zeros(7 * len(names))
+        env = SimpleNamespace(
+            obj_qpos_addr={name: 7 * i for i, name in enumerate(names)},
+            sim=SimpleNamespace(data=SimpleNamespace(qpos=qpos)),
+        )
+        return env, qpos
+
+    def test_utensil_placed_before_objects_on_it(self):
+        env, qpos = self.make_env(["food", "pot", "plate"])
+        qpos[14:17] = [1.0, 2.0, 3.0]
+
+        # food sits on pot, which is itself moved onto plate in the same batch
+        target_pos = BasicEnvChef._place_on_utensils(
+            env, ["food", "pot"], ["pot", "plate"], [[0, 0, 0.1], [0, 0, 0.2]]
+        )
+
+        np.testing.assert_allclose(target_pos, [[1.0, 2.0, 3.3], [1.0, 2.0, 3.2]])
+        np.testing.assert_allclose(qpos[7:10], [1.0, 2.0, 3.2])
+        np.testing.assert_allclose(qpos[0:3], [1.0, 2.0, 3.3])
+
+    def test_matches_sequential_placement(self):
+        names = ["a", "b", "c", "d"]
+        env, qpos = self.make_env(names)
+        qpos[:] = np.arange(len(qpos))
+        expected = qpos.copy()
+
+        obj_names = ["a", "c", "b"]
+        utensil_names = ["b", "d", "c"]
+        offsets = [[0.1, 0, 0], [0, 0.1, 0], [0, 0, 0.1]]
+        target_pos = BasicEnvChef._place_on_utensils(
+            env, obj_names, utensil_names, offsets
+        )
+
+        # place one at a time, each utensil before the objects on it
+        addr = env.obj_qpos_addr
+        for i in (1, 2, 0):
+            o, u = addr[obj_names[i]], addr[utensil_names[i]]
+            expected[o : o + 3] = expected[u : u + 3] + offsets[i]
+        np.testing.assert_allclose(qpos, expected)
+        np.testing.assert_allclose(
+            target_pos, [expected[addr[n] : addr[n] + 3] for n in obj_names]
+        )
+
+
+class TestBuildSpawnArrays(unittest.TestCase):
+    def test_only_on_utensil_rows_read_location(self):
+        env = SimpleNamespace()
+        configs = [
+            dict(name="obj_0", location={"fixture": "counter"}),
+            dict(name="obj_1", location=["a", "b"], is_on_utensil=True),
+            dict(name="obj_2", location="pan", is_on_utensil=True),
+            dict(name="obj_3", location="bowl", is_on_utensil=True),
+            dict(name="spatula", is_in_gripper=True, state="in_use"),
+        ]
+        BasicEnvChef._build_spawn_arrays(env, configs)
+
+        self.assertEqual(list(env._utensil_obj_names), ["obj_2", "obj_3"])
+        self.assertEqual(list(env._utensil_locations), ["pan", "bowl"])
+        np.testing.assert_allclose(env._utensil_offsets, [[0, 0, 0.05], [0, 0, 0.02]])
+        self.assertEqual(list(env._spawn_names[env._spawn_in_gripper]), ["spatula"])
+
+    def test_no_configs(self):
+        env = SimpleNamespace()
+        BasicEnvChef._build_spawn_arrays(env, [])
+        self.assertEqual(env._utensil_offsets.shape, (0, 3))
+        self.assertEqual(len(env._spawn_names[env._spawn_in_gripper]), 0)
+
+
+class StubFixture(Fixture):
+    def __init__(self, n_regions=1):
+        self._obj = ET.Element("body", pos="1 2 0.5", euler="0 0 0.3")
+        self.rng = np.random.default_rng(0)
+        self.n_regions = n_regions
+        self.set_int_size(0.4, 0.3)
+
+    def set_int_size(self, x, y):
+        """moves the interior sites, as Drawer.update_state does when it opens"""
+        self.int_sites = [
+            np.array([-x / 2, -y / 2, 0.1]),
+            np.array([x / 2, -y / 2, 0.1]),
+            np.array([-x / 2, y / 2, 0.1]),
+            np.array([-x / 2, -y / 2, 0.3]),
+        ]
+
+    def get_int_sites(self, *args, **kwargs):
+        return self.int_sites
+
+    def get_reset_regions(self, *args, **kwargs):
+        regions = super().get_reset_regions(*args, **kwargs)
+        for i in range(1, self.n_regions):
+            regions[f"region_{i}"] = regions["bottom"]
+        return regions
+
+
+class TestPlacementInitializerCache(unittest.TestCase):
+    def make_env(self, n_regions=1):
+        fixture = StubFixture(n_regions)
+        env = BasicEnvChef.__new__(BasicEnvChef)
+        env._placement_init_cache = {}
+        env.rng = np.random.default_rng(0)
+        env.fixtures = {}
+        env.objects = {
+            f"obj_{i}": BoxObject(f"obj_{i}", size=[0.02, 0.02, 0.02])
+            for i in range(_basicEnv_chef._PLACEMENT_CACHE_SIZE + 5)
+        }
+        env.get_fixture = mock.Mock(return_value=fixture)
+        env._get_placement_initializer = mock.Mock(wraps=env._get_placement_initializer)
+        return env, fixture
+
+    def make_cfgs(self, name="obj_0", **placement):
+        placement = dict(fixture="drawer", margin=0.0, **placement)
+        return [dict(name=name, type="object", placement=placement)]
+
+    def test_deterministic_config_is_cached(self):
+        env, _ = self.make_env()
+        cfgs = self.make_cfgs()
+        first = env._get_cached_placement_initializer(cfgs)
+        self.assertIs(env._get_cached_placement_initializer(cfgs), first)
+        self.assertEqual(env._get_placement_initializer.call_count, 1)
+
+    def test_random_configs_are_not_cached(self):
+        for (env, _), cfgs in (
+            (self.make_env(), self.make_cfgs(ref="sink")),
+            (self.make_env(n_regions=2), self.make_cfgs()),
+        ):
+            first = env._get_cached_placement_initializer(cfgs)
+            self.assertIsNot(env._get_cached_placement_initializer(cfgs), first)
+            self.assertEqual(env._get_placement_initializer.call_count, 2)
+
+    def test_sampler_follows_moved_region(self):
+        env, fixture = self.make_env()
+        cfgs = self.make_cfgs()
+
+        sampler = env._get_cached_placement_initializer(cfgs).samplers["obj_0_Sampler"]
+        np.testing.assert_allclose(sampler.x_range, [-0.2, 0.2])
+        np.testing.assert_allclose(sampler.y_range, [-0.15, 0.15])
+        np.testing.assert_allclose(sampler.reference_pos, [1.0, 2.0, 0.6])
+
+        # the drawer opens: its interior grows and moves along y
+        fixture.set_int_size(0.4, 0.5)
+        for site in fixture.int_sites:
+            site[1] -= 0.1
+        sampler = env._get_cached_placement_initializer(cfgs).samplers["obj_0_Sampler"]
+        np.testing.assert_allclose(sampler.x_range, [-0.2, 0.2])
+        np.testing.assert_allclose(sampler.y_range, [-0.35, 0.15])
+        self.assertEqual(env._get_placement_initializer.call_count, 2)
+
+        # back to the first state reuses the first initializer
+        fixture.set_int_size(0.4, 0.3)
+        env._get_cached_placement_initializer(cfgs)
+        self.assertEqual(env._get_placement_initializer.call_count, 2)
+
+    def test_cache_is_bounded(self):
+        env, _ = self.make_env()
+        size = _basicEnv_chef._PLACEMENT_CACHE_SIZE
+        for i in range(size + 5):
+            env._get_cached_placement_initializer(self.make_cfgs(name=f"obj_{i}"))
+        self.assertEqual(len(env._placement_init_cache), size)
+
+
+class TestOpenFixtures(unittest.TestCase):
+    def test_setter_stores_immutable_copy(self):
+        env = BasicEnvChef.__new__(BasicEnvChef)
+        open_fixtures = ["cab_1"]
+        env.open_fixtures = open_fixtures
+        open_fixtures.append("fridge")
+
+        self.assertEqual(env.open_fixtures, ("cab_1",))
+        self.assertFalse(env._fridge_open)
+        with self.assertRaises(AttributeError):
+            env.open_fixtures.append("fridge")
+
+    def test_reassignment_updates_open_states(self):
+        env = BasicEnvChef.__new__(BasicEnvChef)
+        env.open_fixtures = []
+        cab, fridge_cab = object(), object()
+        env._openable_fixtures = [("cab_1", cab), ("fridge_cab", fridge_cab)]
+        env._resolve_fixture_open_states()
+        self.assertEqual([x[2] for x in env._fixture_should_open], [False, False])
+
+        env.open_fixtures = env.open_fixtures + ("cab_1", "fridge")
+        self.assertEqual([x[2] for x in env._fixture_should_open], [True, True])
+
+
+class TestComposePose(unittest.TestCase):
+    def test_matches_python_source(self):
+        rng = np.random.default_rng(0)
+        for _ in range(5):
+            pos, offset = rng.normal(size=3), rng.normal(size=3)
+            quat = rng.normal(size=4)
+            expected, actual = np.empty(7), np.empty(7)
+            _chef_kernels_src.compose_pose(pos, offset, quat, expected)
+            _basicEnv_chef._compose_pose(pos, offset, quat, actual)
+            np.testing.assert_array_equal(actual, expected)
+            np.testing.assert_array_equal(expected[:3], pos + offset)
+            np.testing.assert_array_equal(expected[3:], quat)
+
+    def test_writes_into_qpos_slice(self):
+        qpos = np.zeros(14)
+        _basicEnv_chef._compose_pose(
+            np.ones(3), np.full(3, 0.5), np.array([1.0, 0, 0, 0]), qpos[7:14]
+        )
+        np.testing.assert_array_equal(qpos[:7], 0)
+        np.testing.assert_array_equal(qpos[7:], [1.5, 1.5, 1.5, 1, 0, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
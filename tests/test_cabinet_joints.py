@@ -0,0 +1,56 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+from robocasa.models.fixtures.cabinets import HingeCabinet
+
+
+def make_sim(addrs):
+    qpos = np.arange(10, dtype=float) / 10
+    model = SimpleNamespace(get_joint_qpos_addr=mock.Mock(side_effect=addrs.get))
+    return SimpleNamespace(model=model, data=SimpleNamespace(qpos=qpos))
+
+
+def make_cabinet(joints):
+    cab = HingeCabinet.__new__(HingeCabinet)
+    cab._name = "cab"
+    cab._joints = joints
+    return cab
+
+
+class TestCabinetJointAddrs(unittest.TestCase):
+    addrs = {"cab_rightdoorhinge": 3, "cab_leftdoorhinge": 5}
+
+    def test_door_and_state_share_one_lookup_per_sim(self):
+        cab = make_cabinet(["rightdoorhinge", "leftdoorhinge"])
+        sim = make_sim(self.addrs)
+
+        right_addr, left_addr = cab._door_joint_qpos_addrs(sim)
+        self.assertEqual((right_addr, left_addr), (3, 5))
+        state = cab.get_state(sim)
+        self.assertEqual(state, {"cab_rightdoorhinge": 0.3, "cab_leftdoorhinge": 0.5})
+        cab.get_state(sim)
+        cab._door_joint_qpos_addrs(sim)
+        # the door joints and the state joints are the same, so they are resolved once
+        self.assertEqual(sim.model.get_joint_qpos_addr.call_count, 2)
+
+        # a new sim resolves the addresses again
+        new_sim = make_sim({"cab_rightdoorhinge": 1, "cab_leftdoorhinge": 2})
+        self.assertEqual(
+            cab.get_state(new_sim),
+            {"cab_rightdoorhinge": 0.1, "cab_leftdoorhinge": 0.2},
+        )
+        self.assertEqual(list(cab._door_joint_qpos_addrs(new_sim)), [1, 2])
+
+    def test_multi_dof_joint_read_as_slice(self):
+        cab = make_cabinet(["rightdoorhinge", "free"])
+        sim = make_sim({"cab_rightdoorhinge": 0, "cab_free": (3, 6)})
+        state = cab.get_state(sim)
+        self.assertEqual(state["cab_rightdoorhinge"], 0.0)
+        np.testing.assert_array_equal(state["cab_free"], [0.3, 0.4, 0.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
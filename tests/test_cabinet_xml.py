@@ -0,0 +1,21 @@
+import unittest
+
+import numpy as np
+
+from robocasa.models.fixtures.cabinets import _a2s_cached, _a2s_floats
+
+
+class TestA2sCached(unittest.TestCase):
+    def test_equal_values_format_the_same(self):
+        _a2s_floats.cache_clear()
+        expected = "0.0 0.0 0.0"
+        for values in [(0, 0, 0), (0.0, 0.0, 0.0), tuple(np.zeros(3)), [0, 0.0, 0]]:
+            self.assertEqual(_a2s_cached(values), expected)
+
+        _a2s_floats.cache_clear()
+        self.assertEqual(_a2s_cached(np.array([-3, 0])), "-3.0 0.0")
+        self.assertEqual(_a2s_cached((-3.0, 0)), "-3.0 0.0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+import robosuite
+
+from robocasa.utils.env_utils import EnvPool, make_env_pool
+
+
+class FakeEnv:
+    action_spec = (-np.ones(3), np.ones(3))
+
+    def __init__(self, idx=0, **kwargs):
+        self.idx = idx
+        self.kwargs = kwargs
+        self.actions = []
+        self.threads = set()
+        self.closed = False
+
+    def reset(self):
+        self.actions = []
+        return {"idx": self.idx}
+
+    def step(self, action):
+        self.threads.add(threading.get_ident())
+        self.actions.append(np.array(action))
+        return {"idx": self.idx}, float(self.idx), False, {}
+
+    def close(self):
+        self.closed = True
+
+
+class TestEnvPool(unittest.TestCase):
+    def test_step_dispatches_actions_in_order(self):
+        envs = [FakeEnv(i) for i in range(4)]
+        pool = EnvPool(envs, max_workers=2)
+        self.assertEqual(len(pool), 4)
+        self.assertIs(pool.action_spec, FakeEnv.action_spec)
+
+        self.assertEqual(pool.reset(), [{"idx": i} for i in range(4)])
+        actions = np.arange(12, dtype=float).reshape(4, 3)
+        results = pool.step(actions)
+
+        self.assertEqual([r[1] for r in results], [0.0, 1.0, 2.0, 3.0])
+        for env, action in zip(envs, actions):
+            self.assertEqual(len(env.actions), 1)
+            np.testing.assert_array_equal(env.actions[0], action)
+            # environments are stepped on the pool's worker threads
+            self.assertNotIn(threading.get_ident(), env.threads)
+
+        pool.close()
+        self.assertTrue(all(env.closed for env in envs))
+
+    def test_step_requires_one_action_per_env(self):
+        pool = EnvPool([FakeEnv(i) for i in range(3)])
+        with self.assertRaises(AssertionError):
+            pool.step(np.zeros((2, 3)))
+        pool.close()
+
+    def test_make_env_pool_seeds_each_env(self):
+        with mock.patch.object(robosuite, "make", side_effect=FakeEnv) as make:
+            pool = make_env_pool(3, seed=10, env_name="Kitchen", robots="Panda")
+        self.assertEqual(make.call_count, 3)
+        self.assertEqual([env.kwargs["seed"] for env in pool.envs], [10, 11, 12])
+        self.assertTrue(all(env.kwargs["env_name"] == "Kitchen" for env in pool.envs))
+        pool.close()
+
+        with mock.patch.object(robosuite, "make", side_effect=FakeEnv):
+            pool = make_env_pool(2, env_name="Kitchen")
+        self.assertTrue(all("seed" not in env.kwargs for env in pool.envs))
+        pool.close()
+
+    def test_robosuite_envs(self):
+        pool = make_env_pool(
+            2,
+            env_name="Lift",
+            robots="Panda",
+            has_renderer=False,
+            has_offscreen_renderer=False,
+            use_camera_obs=False,
+            ignore_done=True,
+        )
+        obs = pool.reset()
+        self.assertEqual(len(obs), 2)
+        low, high = pool.action_spec
+        for _ in range(3):
+            results = pool.step(np.random.uniform(low, high, size=(2, len(low))))
+        self.assertEqual(len(results), 2)
+        for env, (ob, _, _, _) in zip(pool.envs, results):
+            np.testing.assert_allclose(
+                ob["cube_pos"], env.sim.data.body_xpos[env.cube_body_id]
+            )
+        pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
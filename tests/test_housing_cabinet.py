@@ -0,0 +1,109 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from robocasa.models.fixtures.cabinets import (
+    _PADDING_MISMATCH,
+    _PADDING_OK,
+    _PADDING_UNDERSPECIFIED,
+    HousingCabinet,
+    _resolve_housing_padding,
+)
+
+
+def resolve(size, padding, interior_size):
+    size = np.array(size, dtype=np.float64)
+    padding = np.array(padding, dtype=np.float64)
+    status = _resolve_housing_padding(
+        size, padding, np.array(interior_size, dtype=np.float64)
+    )
+    return status, size, padding
+
+
+class TestResolveHousingPadding(unittest.TestCase):
+    nan = np.nan
+    interior_size = [0.5, 0.4, 0.6]
+
+    def test_resolves_unspecified_entries(self):
+        nan = self.nan
+        status, size, padding = resolve(
+            [0.7, nan, 1.0],
+            [[nan, nan], [0.05, 0.1], [0.2, nan]],
+            self.interior_size,
+        )
+        self.assertEqual(status, _PADDING_OK)
+        # x: (0.7 - 0.5) / 2 on each side
+        # y: 0.05 + 0.4 + 0.1
+        # z: 1.0 - 0.6 - 0.2
+        np.testing.assert_allclose(size, [0.7, 0.55, 1.0])
+        np.testing.assert_allclose(padding, [[0.1, 0.1], [0.05, 0.1], [0.2, 0.2]])
+
+    def test_resolves_single_missing_padding(self):
+        nan = self.nan
+        status, size, padding = resolve(
+            [0.7, 0.45, 1.0],
+            [[nan, 0.05], [nan, 0.1], [0.1, 0.3]],
+            self.interior_size,
+        )
+        self.assertEqual(status, _PADDING_OK)
+        # x: 0.7 - 0.5 - 0.05, y: 0.45 - 0.4 - 0.1 (negative front padding)
+        np.testing.assert_allclose(size, [0.7, 0.45, 1.0])
+        np.testing.assert_allclose(padding, [[0.15, 0.05], [-0.05, 0.1], [0.1, 0.3]])
+
+    def test_underspecified(self):
+        nan = self.nan
+        status, _, _ = resolve(
+            [0.7, nan, 1.0],
+            [[nan, nan], [0.05, nan], [nan, nan]],
+            self.interior_size,
+        )
+        self.assertEqual(status, _PADDING_UNDERSPECIFIED)
+
+    def test_mismatch(self):
+        status, _, _ = resolve(
+            [0.7, 0.6, 1.0],
+            [[0.1, 0.1], [0.1, 0.2], [0.2, 0.2]],
+            self.interior_size,
+        )
+        self.assertEqual(status, _PADDING_MISMATCH)
+
+
+class TestHousingCabinetPadding(unittest.TestCase):
+    interior_obj = SimpleNamespace(size=np.array([0.5, 0.4, 0.6]))
+
+    def test_missing_size_and_padding(self):
+        with self.assertRaises(ValueError):
+            HousingCabinet(self.interior_obj)
+
+    def test_underspecified(self):
+        with self.assertRaisesRegex(ValueError, "both padding values"):
+            HousingCabinet(
+                self.interior_obj,
+                size=[0.7, None, 1.0],
+                padding=[None, [0.05, None], None],
+            )
+
+    def test_mismatch(self):
+        with self.assertRaises(AssertionError):
+            HousingCabinet(
+                self.interior_obj,
+                size=[0.7, 0.6, 1.0],
+                padding=[[0.1, 0.1], [0.1, 0.2], [0.2, 0.2]],
+            )
+
+    def test_negative_padding(self):
+        # cabinet narrower than its interior object
+        with self.assertRaisesRegex(ValueError, "Negative"):
+            HousingCabinet(self.interior_obj, size=[0.3, 0.5, 1.0])
+        # negative back padding
+        with self.assertRaisesRegex(ValueError, "Negative"):
+            HousingCabinet(
+                self.interior_obj,
+                size=[0.7, 0.45, 1.0],
+                padding=[None, [0.1, None], None],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+import robocasa.utils.object_utils as OU
+
+
+class TestSetGeomDimensionsBatch(unittest.TestCase):
+    sides = ("left", "door", "trim_top", "back")
+    dims = np.array(
+        [
+            [0.01, 0.25, 0.4, -0.3, 0.0, 0.1],
+            [0.3, 0.01, 0.45, 0.0, -0.26, 0.05],
+            [0.31, 0.02, 0.015, 0.0, -0.27, 0.47],
+            [0.3, 0.005, 0.4, 0.0, 0.25, 0.1],
+        ]
+    )
+
+    def make_geoms(self):
+        return {side: [ET.Element("geom"), ET.Element("geom")] for side in self.sides}
+
+    def set_both(self, rotated):
+        sizes = {side: list(row[:3]) for side, row in zip(self.sides, self.dims)}
+        positions = {side: list(row[3:]) for side, row in zip(self.sides, self.dims)}
+        expected = self.make_geoms()
+        OU.set_geom_dimensions(sizes, positions, expected, rotated=rotated)
+
+        actual = self.make_geoms()
+        OU.set_geom_dimensions_batch(self.sides, self.dims, actual, rotated=rotated)
+        return expected, actual
+
+    def assert_geoms_equal(self, expected, actual):
+        for side in self.sides:
+            for exp_geom, act_geom in zip(expected[side], actual[side]):
+                for attr in ("size", "pos"):
+                    np.testing.assert_array_equal(
+                        OU.string_to_array(act_geom.get(attr)),
+                        OU.string_to_array(exp_geom.get(attr)),
+                        err_msg=f"{side} {attr}",
+                    )
+
+    def test_matches_set_geom_dimensions(self):
+        expected, actual = self.set_both(rotated=False)
+        self.assert_geoms_equal(expected, actual)
+
+    def test_rotated_swaps_door_and_trim(self):
+        expected, actual = self.set_both(rotated=True)
+        self.assert_geoms_equal(expected, actual)
+
+        # only door and trim sizes have their y and z swapped
+        for i, side in enumerate(self.sides):
+            size = OU.string_to_array(actual[side][0].get("size"))
+            if "door" in side or "trim" in side:
+                np.testing.assert_array_equal(size, self.dims[i, [0, 2, 1]])
+            else:
+                np.testing.assert_array_equal(size, self.dims[i, :3])
+
+    def test_dims_not_modified(self):
+        dims = self.dims.copy()
+        OU.set_geom_dimensions_batch(self.sides, dims, self.make_geoms(), rotated=True)
+        np.testing.assert_array_equal(dims, self.dims)
+
+    def test_missing_geom_raises(self):
+        geoms = self.make_geoms()
+        geoms["door"] = [None]
+        with self.assertRaises(ValueError):
+            OU.set_geom_dimensions_batch(self.sides, self.dims, geoms)
+
+        sizes = {side: list(row[:3]) for side, row in zip(self.sides, self.dims)}
+        positions = {side: list(row[3:]) for side, row in zip(self.sides, self.dims)}
+        with self.assertRaises(ValueError):
+            OU.set_geom_dimensions(sizes, positions, geoms)
+
+
+if __name__ == "__main__":
+    unittest.main()